@@ -0,0 +1,39 @@
+"""Add habit query indexes.
+
+Revision ID: 0003_add_habit_query_indexes
+Revises: 0002_add_user_token_version
+Create Date: 2025-02-01 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0003_add_habit_query_indexes"
+down_revision = "0002_add_user_token_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_habits_user_active_id",
+        "habits",
+        ["user_id", "is_active", "id"],
+        unique=False
+    )
+    op.create_index(
+        "idx_habit_monthly_bits_month_habit",
+        "habit_monthly_bits",
+        ["month", "habit_id"],
+        unique=False
+    )
+    op.drop_index("ix_habits_id", table_name="habits")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_index("ix_sleep_entries_id", table_name="sleep_entries")
+
+
+def downgrade() -> None:
+    op.create_index("ix_sleep_entries_id", "sleep_entries", ["id"], unique=False)
+    op.create_index("ix_users_id", "users", ["id"], unique=False)
+    op.create_index("ix_habits_id", "habits", ["id"], unique=False)
+    op.drop_index("idx_habit_monthly_bits_month_habit", table_name="habit_monthly_bits")
+    op.drop_index("idx_habits_user_active_id", table_name="habits")
@@ -0,0 +1,30 @@
+"""Add packed yearly habit archive.
+
+Revision ID: 0004_add_habit_yearly_bits
+Revises: 0003_add_habit_query_indexes
+Create Date: 2025-03-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_add_habit_yearly_bits"
+down_revision = "0003_add_habit_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "habit_yearly_bits",
+        sa.Column("habit_id", sa.BigInteger(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month_mask", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("day_bits", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["habit_id"], ["habits.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("habit_id", "year"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("habit_yearly_bits")
@@ -0,0 +1,148 @@
+"""Partition habit_monthly_bits and sleep_entries by year.
+
+Revision ID: 0005_partition_history_tables
+Revises: 0004_add_habit_yearly_bits
+Create Date: 2025-03-15 00:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_partition_history_tables"
+down_revision = "0004_add_habit_yearly_bits"
+branch_labels = None
+depends_on = None
+
+YEARS_AHEAD = 1
+
+HABIT_BITS_COLUMNS = """
+    habit_id BIGINT NOT NULL REFERENCES habits (id) ON DELETE CASCADE,
+    month DATE NOT NULL,
+    day_bits BIT(31) NOT NULL
+"""
+SLEEP_COLUMNS = """
+    id BIGINT NOT NULL DEFAULT nextval('sleep_entries_id_seq'),
+    user_id BIGINT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    sleep_date DATE NOT NULL,
+    duration_hours DOUBLE PRECISION NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+"""
+
+
+def _year_range(table: str, column: str) -> range:
+    bind = op.get_bind()
+    row = bind.execute(
+        sa.text(
+            f"SELECT CAST(extract(year FROM min({column})) AS INTEGER), "
+            f"CAST(extract(year FROM max({column})) AS INTEGER) FROM {table}"
+        )
+    ).first()
+    current_year = date.today().year
+    first_year = min(row[0] or current_year, current_year)
+    last_year = max(row[1] or current_year, current_year + YEARS_AHEAD)
+    return range(first_year, last_year + 1)
+
+
+def _rename_constraints(table: str, staging: str, foreign_key: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {staging}_pkey TO {table}_pkey")
+    op.execute(
+        f"ALTER TABLE {table} RENAME CONSTRAINT {staging}_{foreign_key}_fkey "
+        f"TO {table}_{foreign_key}_fkey"
+    )
+
+
+def _swap_in_partitioned(
+    table: str, column: str, columns: str, primary_key: str, foreign_key: str, years: range
+) -> None:
+    staging = f"{table}_partitioned"
+    op.execute(
+        f"CREATE TABLE {staging} ({columns}, "
+        f"CONSTRAINT {staging}_pkey PRIMARY KEY ({primary_key})) "
+        f"PARTITION BY RANGE ({column})"
+    )
+    for year in years:
+        op.execute(
+            f"CREATE TABLE {table}_y{year} PARTITION OF {staging} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    op.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    _rename_constraints(table, staging, foreign_key)
+
+
+def _swap_in_plain(table: str, columns: str, primary_key: str, foreign_key: str) -> None:
+    staging = f"{table}_plain"
+    op.execute(
+        f"CREATE TABLE {staging} ({columns}, "
+        f"CONSTRAINT {staging}_pkey PRIMARY KEY ({primary_key}))"
+    )
+    op.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    _rename_constraints(table, staging, foreign_key)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _swap_in_partitioned(
+        "habit_monthly_bits",
+        "month",
+        HABIT_BITS_COLUMNS,
+        "habit_id, month",
+        "habit_id",
+        _year_range("habit_monthly_bits", "month")
+    )
+    op.create_index(
+        "idx_habit_monthly_bits_month_habit",
+        "habit_monthly_bits",
+        ["month", "habit_id"],
+        unique=False
+    )
+
+    op.execute("ALTER SEQUENCE sleep_entries_id_seq OWNED BY NONE")
+    _swap_in_partitioned(
+        "sleep_entries",
+        "sleep_date",
+        SLEEP_COLUMNS,
+        "id, sleep_date",
+        "user_id",
+        _year_range("sleep_entries", "sleep_date")
+    )
+    op.execute("ALTER SEQUENCE sleep_entries_id_seq OWNED BY sleep_entries.id")
+    op.create_index("ix_sleep_entries_sleep_date", "sleep_entries", ["sleep_date"], unique=False)
+    op.create_index(
+        "idx_sleep_entries_user_date",
+        "sleep_entries",
+        ["user_id", "sleep_date"],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _swap_in_plain("habit_monthly_bits", HABIT_BITS_COLUMNS, "habit_id, month", "habit_id")
+    op.create_index(
+        "idx_habit_monthly_bits_month_habit",
+        "habit_monthly_bits",
+        ["month", "habit_id"],
+        unique=False
+    )
+
+    op.execute("ALTER SEQUENCE sleep_entries_id_seq OWNED BY NONE")
+    _swap_in_plain("sleep_entries", SLEEP_COLUMNS, "id", "user_id")
+    op.execute("ALTER SEQUENCE sleep_entries_id_seq OWNED BY sleep_entries.id")
+    op.create_index("ix_sleep_entries_sleep_date", "sleep_entries", ["sleep_date"], unique=False)
+    op.create_index(
+        "idx_sleep_entries_user_date",
+        "sleep_entries",
+        ["user_id", "sleep_date"],
+        unique=True
+    )
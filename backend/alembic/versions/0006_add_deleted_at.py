@@ -0,0 +1,30 @@
+"""Add deleted_at for retention purges.
+
+Revision ID: 0006_add_deleted_at
+Revises: 0005_partition_history_tables
+Create Date: 2025-04-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_add_deleted_at"
+down_revision = "0005_partition_history_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("habits", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("users", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute(
+        "UPDATE habits SET deleted_at = COALESCE(updated_at, created_at) "
+        "WHERE is_active IS false"
+    )
+    op.create_index("idx_habits_deleted_at", "habits", ["deleted_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_habits_deleted_at", table_name="habits")
+    op.drop_column("users", "deleted_at")
+    op.drop_column("habits", "deleted_at")
@@ -1,18 +1,23 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.schemas.admin import AdminReport, AdminStats
-from app.services import habit_service, sleep_service, user_service
-from app.core.database import get_db
+from app.schemas.admin import AdminReport, AdminStats, Leaderboard
+from app.services import habit_service, leaderboard_service, sleep_service, user_service
+from app.core.database import get_db, get_read_db, pool_checkout_wait, session_lifetime, session_unused
+from app.core.metrics import registry
+from app.core.query_budget import query_budget
+from app.core.responses import FastJSONResponse
 from app.utils.dependencies import require_admin
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/stats", response_model=AdminStats)
+@query_budget(5)
 async def get_admin_stats(
     _admin=Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> AdminStats:
     users = user_service.list_users(db)
     user_ids = [user.id for user in users]
@@ -27,12 +32,45 @@ async def get_admin_stats(
 
 
 @router.get("/report", response_model=AdminReport)
+@query_budget(8)
 async def get_admin_report(
     _admin=Depends(require_admin),
-    db: Session = Depends(get_db)
-) -> AdminReport:
+    db: Session = Depends(get_read_db)
+) -> FastJSONResponse:
     user_ids = [user.id for user in user_service.list_users(db)]
     report = habit_service.get_admin_report(db, user_ids)
     sleep_report = sleep_service.get_admin_sleep_report(db, user_ids)
     report["sleepReport"] = sleep_report
-    return AdminReport(**report)
+    return FastJSONResponse(report)
+
+
+@router.get("/leaderboard", response_model=Leaderboard)
+@query_budget(4)
+async def get_leaderboard(
+    _admin=Depends(require_admin),
+    db: Session = Depends(get_db),
+    limit: int = Query(default=10, ge=1, le=100),
+    user_id: int | None = Query(default=None, alias="userId")
+) -> Leaderboard:
+    board = await run_in_threadpool(leaderboard_service.get_leaderboard, db, limit, user_id)
+    return Leaderboard(**board)
+
+
+def _labelled(snapshot: dict) -> dict:
+    return {",".join(key) or "all": value for key, value in snapshot.items()}
+
+
+@router.get("/db-pool", response_model=dict)
+@query_budget(2)
+async def get_db_pool_stats(_admin=Depends(require_admin)) -> dict:
+    saturation = next(
+        metric for metric in registry.metrics() if metric.name == "db_pool_saturation_ratio"
+    )
+    return {
+        "saturation": _labelled(saturation.snapshot()),
+        "checkoutWait": _labelled(pool_checkout_wait.snapshot()),
+        "checkoutWaitBuckets": list(pool_checkout_wait.buckets),
+        "sessionLifetime": _labelled(session_lifetime.snapshot()),
+        "sessionLifetimeBuckets": list(session_lifetime.buckets),
+        "unusedSessions": _labelled(session_unused.snapshot())
+    }
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+import math
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.schemas.auth import LoginRequest, SignupRequest, Token
 from app.services import auth_service, user_service
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.query_budget import query_budget
+from app.core.rate_limit import login_limiter
 from app.utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -31,22 +35,53 @@ def _clear_auth_cookie(response: Response) -> None:
     )
 
 
+def _email_key(email: str) -> str:
+    return f"login:email:{email.strip().lower()}"
+
+
+def _throttle_login(request: Request, email: str) -> None:
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return
+    ip_address = request.client.host if request.client else "unknown"
+    retry_after = login_limiter.hit(
+        f"login:ip:{ip_address}", settings.LOGIN_RATE_IP_PER_MINUTE, settings.LOGIN_RATE_IP_BURST
+    )
+    if not retry_after:
+        retry_after = login_limiter.hit(
+            _email_key(email),
+            settings.LOGIN_RATE_EMAIL_PER_MINUTE,
+            settings.LOGIN_RATE_EMAIL_BURST
+        )
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+
+
 @router.post("/login", response_model=Token)
+@query_budget(4)
 async def login(
     payload: LoginRequest,
     request: Request,
     response: Response,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ) -> Token:
-    result = auth_service.login(db, payload.email, payload.password, request)
+    _throttle_login(request, payload.email)
+    result = auth_service.login(db, payload.email, payload.password, request, background_tasks)
     if not result:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if settings.LOGIN_RATE_LIMIT_ENABLED:
+        login_limiter.refund(_email_key(payload.email), settings.LOGIN_RATE_EMAIL_BURST)
     token, reset_required = result
     _set_auth_cookie(response, token)
     return Token(access_token=token, reset_required=reset_required)
 
 
 @router.post("/signup", response_model=Token)
+@query_budget(6)
 async def signup(
     payload: SignupRequest,
     request: Request,
@@ -65,6 +100,7 @@ async def signup(
 
 
 @router.post("/logout", response_model=dict)
+@query_budget(4)
 async def logout(
     response: Response,
     user=Depends(get_current_user),
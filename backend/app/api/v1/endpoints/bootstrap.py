@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.schemas.bootstrap import BootstrapResponse
+from app.services import habit_service, sleep_service
+from app.core.database import get_db
+from app.core.query_budget import query_budget
+from app.core.responses import FastJSONResponse
+from app.utils.dependencies import get_current_user
+from app.utils.helpers import parse_fields
+
+router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
+
+BOOTSTRAP_SECTIONS = ("user", "dashboard", "habits", "sleep")
+
+
+@router.get("", response_model=BootstrapResponse)
+@query_budget(11)
+async def get_bootstrap(
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+    month: str | None = Query(default=None),
+    sections: str | None = Query(default=None)
+) -> FastJSONResponse:
+    try:
+        month_key = habit_service.parse_month(month)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid month format")
+    try:
+        section_set = parse_fields(sections, BOOTSTRAP_SECTIONS) or set(BOOTSTRAP_SECTIONS)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sections")
+    payload = {}
+    if "user" in section_set:
+        payload["user"] = {
+            "id": user.id,
+            "name": user.full_name,
+            "email": user.email,
+            "status": user.status,
+            "bio": user.bio,
+            "avatarUrl": user.avatar_url
+        }
+    if section_set & {"dashboard", "habits"}:
+        overview = habit_service.get_month_overview(db, user.id, month_key)
+        for key in ("dashboard", "habits"):
+            if key in section_set:
+                payload[key] = overview[key]
+    if "sleep" in section_set:
+        payload["sleep"] = sleep_service.list_sleep(db, user.id, month_key)
+    return FastJSONResponse(payload)
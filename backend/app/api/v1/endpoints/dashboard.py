@@ -3,19 +3,24 @@ from sqlalchemy.orm import Session
 
 from app.schemas.dashboard import DashboardResponse
 from app.services import habit_service, user_service
-from app.core.database import get_db
+from app.core.database import get_history_db
+from app.core.query_budget import query_budget
+from app.core.responses import FastJSONResponse
 from app.utils.dependencies import get_current_user
+from app.utils.helpers import parse_fields
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("", response_model=DashboardResponse)
+@query_budget(9)
 async def get_dashboard(
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_history_db),
     user_id: int | None = Query(default=None, alias="userId"),
-    month: str | None = Query(default=None)
-) -> DashboardResponse:
+    month: str | None = Query(default=None),
+    fields: str | None = Query(default=None)
+) -> FastJSONResponse:
     target_user_id = user.id
     if user_id is not None and user.role == "admin":
         if not user_service.get_user(db, user_id):
@@ -25,5 +30,9 @@ async def get_dashboard(
         month_key = habit_service.parse_month(month)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid month format")
-    data = habit_service.get_dashboard(db, target_user_id, month_key)
-    return DashboardResponse(**data)
+    try:
+        field_set = parse_fields(fields, habit_service.DASHBOARD_FIELDS)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid fields")
+    data = habit_service.get_dashboard(db, target_user_id, month_key, field_set)
+    return FastJSONResponse(data)
@@ -0,0 +1,50 @@
+import asyncio
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.events import event_bus
+from app.core.query_budget import query_budget
+from app.core.responses import dumps
+from app.utils.dependencies import get_current_user
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _format_event(event: dict) -> bytes:
+    return b"event: " + event["type"].encode() + b"\ndata: " + dumps(event) + b"\n\n"
+
+
+@router.get("/stream")
+@query_budget(2)
+async def stream_events(
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    user_id = user.id
+    db.close()
+    queue = event_bus.subscribe(user_id)
+
+    async def event_source():
+        try:
+            yield b"retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=settings.EVENTS_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield _format_event(event)
+        finally:
+            event_bus.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
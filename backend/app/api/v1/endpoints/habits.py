@@ -3,19 +3,38 @@ from sqlalchemy.orm import Session
 
 from app.schemas.habit import HabitCreate, HabitToggle, HabitsResponse
 from app.services import habit_service, user_service
-from app.core.database import get_db
-from app.utils.dependencies import get_current_user
+from app.core.database import get_db, get_history_db
+from app.core.query_budget import query_budget
+from app.core.responses import FastJSONResponse
+from app.utils.dependencies import get_client_id, get_current_user
+from app.utils.helpers import parse_fields
 
 router = APIRouter(prefix="/habits", tags=["habits"])
 
+ENCODING_DESCRIPTION = (
+    "bool (default) returns each row's days as a list of booleans. "
+    "bits or bits-v1 returns days as an integer mask with bit i set when day i+1 is done, "
+    "and adds encoding to the response."
+)
+
+
+def _parse_encoding(value: str | None) -> str:
+    try:
+        return habit_service.parse_encoding(value)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid encoding")
+
 
 @router.get("", response_model=HabitsResponse)
+@query_budget(8)
 async def list_habits(
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_history_db),
     user_id: int | None = Query(default=None, alias="userId"),
-    month: str | None = Query(default=None)
-) -> HabitsResponse:
+    month: str | None = Query(default=None),
+    encoding: str | None = Query(default=None, description=ENCODING_DESCRIPTION),
+    fields: str | None = Query(default=None)
+) -> FastJSONResponse:
     target_user_id = user.id
     if user_id is not None and user.role == "admin":
         if not user_service.get_user(db, user_id):
@@ -25,29 +44,42 @@ async def list_habits(
         month_key = habit_service.parse_month(month)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid month format")
-    data = habit_service.list_habits(db, target_user_id, month_key)
-    return HabitsResponse(**data)
+    encoding_key = _parse_encoding(encoding)
+    try:
+        field_set = parse_fields(fields, habit_service.HABITS_FIELDS)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid fields")
+    data = habit_service.list_habits(db, target_user_id, month_key, encoding_key, field_set)
+    return FastJSONResponse(data)
 
 
 @router.post("", response_model=dict)
+@query_budget(10)
 async def add_habit(
     payload: HabitCreate,
     user=Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> dict:
+    db: Session = Depends(get_db),
+    encoding: str | None = Query(default=None, description=ENCODING_DESCRIPTION),
+    client_id: str | None = Depends(get_client_id)
+) -> FastJSONResponse:
     name = payload.name.strip()
     if not name:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Habit name is required")
-    return habit_service.add_habit(db, user.id, name)
+    encoding_key = _parse_encoding(encoding)
+    return FastJSONResponse(habit_service.add_habit(db, user.id, name, encoding_key, client_id))
 
 
 @router.post("/{habit_id}/toggle", response_model=dict)
+@query_budget(10)
 async def toggle_habit(
     habit_id: int,
     payload: HabitToggle,
     user=Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> dict:
+    db: Session = Depends(get_db),
+    encoding: str | None = Query(default=None, description=ENCODING_DESCRIPTION),
+    client_id: str | None = Depends(get_client_id)
+) -> FastJSONResponse:
+    encoding_key = _parse_encoding(encoding)
     try:
         month_key = habit_service.parse_month(payload.month)
     except ValueError:
@@ -61,20 +93,22 @@ async def toggle_habit(
     if payload.dayIndex < 0 or payload.dayIndex >= day_count:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid day index")
     result = habit_service.toggle_habit(
-        db, user.id, habit_id, payload.dayIndex, payload.done, month_key
+        db, user.id, habit_id, payload.dayIndex, payload.done, month_key, encoding_key, client_id
     )
     if result is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Habit not found")
-    return result
+    return FastJSONResponse(result)
 
 
 @router.delete("/{habit_id}", response_model=dict)
+@query_budget(4)
 async def delete_habit(
     habit_id: int,
     user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    client_id: str | None = Depends(get_client_id)
 ) -> dict:
-    deleted = habit_service.delete_habit(db, user.id, habit_id)
+    deleted = habit_service.delete_habit(db, user.id, habit_id, client_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Habit not found")
     return {"status": "ok"}
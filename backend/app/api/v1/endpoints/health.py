@@ -1,8 +1,11 @@
 from fastapi import APIRouter
 
+from app.core.query_budget import query_budget
+
 router = APIRouter(prefix="/health", tags=["health"])
 
 
 @router.get("")
+@query_budget(0)
 async def health() -> dict:
     return {"status": "ok"}
@@ -0,0 +1,34 @@
+import secrets
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.config import settings
+from app.core.metrics import render_prometheus
+from app.core.query_budget import query_budget
+from app.utils.dependencies import bearer_scheme
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def require_scrape_access(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
+) -> None:
+    if not settings.METRICS_ENDPOINT_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not settings.METRICS_SCRAPE_TOKEN:
+        return
+    token = credentials.credentials if credentials else ""
+    if not secrets.compare_digest(token.encode(), settings.METRICS_SCRAPE_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid scrape token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+@router.get("", response_class=PlainTextResponse, dependencies=[Depends(require_scrape_access)])
+@query_budget(0)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -3,21 +3,26 @@ from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_history_db
+from app.core.query_budget import query_budget
+from app.core.responses import FastJSONResponse
 from app.schemas.sleep import SleepCreate, SleepResponse
 from app.services import sleep_service, user_service
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_client_id, get_current_user
+from app.utils.helpers import parse_fields
 
 router = APIRouter(prefix="/sleep", tags=["sleep"])
 
 
 @router.get("", response_model=SleepResponse)
+@query_budget(5)
 async def list_sleep(
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_history_db),
     user_id: int | None = Query(default=None, alias="userId"),
-    month: str | None = Query(default=None)
-) -> SleepResponse:
+    month: str | None = Query(default=None),
+    fields: str | None = Query(default=None)
+) -> FastJSONResponse:
     target_user_id = user.id
     if user_id is not None and user.role == "admin":
         if not user_service.get_user(db, user_id):
@@ -27,16 +32,22 @@ async def list_sleep(
         month_key = sleep_service.parse_month(month)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid month format")
-    data = sleep_service.list_sleep(db, target_user_id, month_key)
-    return SleepResponse(**data)
+    try:
+        field_set = parse_fields(fields, sleep_service.SLEEP_FIELDS)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid fields")
+    data = sleep_service.list_sleep(db, target_user_id, month_key, field_set)
+    return FastJSONResponse(data)
 
 
 @router.post("", response_model=SleepResponse)
+@query_budget(8)
 async def upsert_sleep(
     payload: SleepCreate,
     user=Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> SleepResponse:
+    db: Session = Depends(get_db),
+    client_id: str | None = Depends(get_client_id)
+) -> FastJSONResponse:
     if payload.hours < 0 or payload.hours > 24:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid hours")
     if sleep_service.month_start(payload.date) != sleep_service.month_start(date.today()):
@@ -49,18 +60,21 @@ async def upsert_sleep(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Sleep entries cannot be logged for future dates"
         )
-    sleep_service.upsert_sleep(db, user.id, payload.date, payload.hours)
+    sleep_service.upsert_sleep(db, user.id, payload.date, payload.hours, client_id)
     data = sleep_service.list_sleep(db, user.id, sleep_service.month_start(payload.date))
-    return SleepResponse(**data)
+    return FastJSONResponse(data)
 
 
 @router.delete("/{entry_id}", response_model=dict)
+@query_budget(4)
 async def delete_sleep(
     entry_id: int,
     user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    entry_date: date | None = Query(default=None, alias="date"),
+    client_id: str | None = Depends(get_client_id)
 ) -> dict:
-    deleted = sleep_service.delete_sleep(db, user.id, entry_id)
+    deleted = sleep_service.delete_sleep(db, user.id, entry_id, entry_date, client_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sleep entry not found")
     return {"status": "ok"}
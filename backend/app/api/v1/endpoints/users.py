@@ -12,14 +12,15 @@ from app.schemas.user import (
 )
 from app.services import habit_service, user_service
 from app.core.security import create_access_token
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.utils.dependencies import get_current_user, require_admin
 from app.core.config import settings
+from app.core.query_budget import query_budget
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-def _serialize_user(db: Session, user) -> dict:
+def _serialize_user(user, habit_counts: dict[int, int]) -> dict:
     joined = user.created_at.date().isoformat() if user.created_at else ""
     return {
         "id": user.id,
@@ -27,21 +28,27 @@ def _serialize_user(db: Session, user) -> dict:
         "email": user.email,
         "status": user.status,
         "joined": joined,
-        "habits": habit_service.get_habit_count(db, user.id)
+        "habits": habit_counts.get(user.id, 0)
     }
 
 
+def _serialize_users(db: Session, users: list) -> list[dict]:
+    habit_counts = habit_service.get_habit_counts(db, [user.id for user in users])
+    return [_serialize_user(user, habit_counts) for user in users]
+
+
 @router.get("", response_model=UserListResponse)
+@query_budget(4)
 async def list_users(
     _admin=Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> UserListResponse:
-    users = user_service.list_users(db)
-    payload = [_serialize_user(db, user) for user in users]
+    payload = _serialize_users(db, user_service.list_users(db))
     return UserListResponse(users=payload, total=len(payload))
 
 
 @router.get("/me", response_model=UserProfile)
+@query_budget(2)
 async def get_me(user=Depends(get_current_user)) -> UserProfile:
     return UserProfile(
         id=user.id,
@@ -54,6 +61,7 @@ async def get_me(user=Depends(get_current_user)) -> UserProfile:
 
 
 @router.post("/me", response_model=UserProfile)
+@query_budget(6)
 async def update_me(
     payload: UserProfileUpdate,
     user=Depends(get_current_user),
@@ -84,6 +92,7 @@ async def update_me(
 
 
 @router.post("", response_model=dict)
+@query_budget(8)
 async def create_user(
     payload: UserCreate,
     _admin=Depends(require_admin),
@@ -94,12 +103,13 @@ async def create_user(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
     status_value = "pending_reset" if payload.require_reset else "active"
     user = user_service.create_user(db, payload.name, payload.email, payload.password, status=status_value)
-    users = user_service.list_users(db)
-    serialized = [_serialize_user(db, item) for item in users]
-    return {"user": _serialize_user(db, user), "users": serialized, "total": len(serialized)}
+    serialized = _serialize_users(db, user_service.list_users(db))
+    created = next((item for item in serialized if item["id"] == user.id), None)
+    return {"user": created, "users": serialized, "total": len(serialized)}
 
 
 @router.post("/{user_id:int}", response_model=dict)
+@query_budget(7)
 async def update_user(
     user_id: int,
     payload: UserUpdate,
@@ -109,12 +119,27 @@ async def update_user(
     user = user_service.update_user(db, user_id, payload.name, payload.email, payload.status)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    users = user_service.list_users(db)
-    serialized = [_serialize_user(db, item) for item in users]
+    serialized = _serialize_users(db, user_service.list_users(db))
+    return {"users": serialized, "total": len(serialized)}
+
+
+@router.delete("/{user_id:int}", response_model=dict)
+@query_budget(5)
+async def delete_user(
+    user_id: int,
+    admin=Depends(require_admin),
+    db: Session = Depends(get_db)
+) -> dict:
+    if user_id == admin.id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete yourself")
+    if not user_service.mark_deleted(db, user_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    serialized = _serialize_users(db, user_service.list_users(db))
     return {"users": serialized, "total": len(serialized)}
 
 
 @router.post("/{user_id:int}/password", response_model=dict)
+@query_budget(4)
 async def change_password(
     user_id: int,
     payload: PasswordUpdate,
@@ -128,6 +153,7 @@ async def change_password(
 
 
 @router.post("/me/password", response_model=dict)
+@query_budget(10)
 async def change_my_password(
     payload: PasswordChange,
     response: Response,
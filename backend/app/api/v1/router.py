@@ -1,11 +1,14 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import admin, auth, dashboard, habits, health, sleep, users
+from app.api.v1.endpoints import admin, auth, bootstrap, dashboard, events, habits, health, metrics, sleep, users
 
 api_router = APIRouter()
 api_router.include_router(health.router)
+api_router.include_router(metrics.router)
 api_router.include_router(auth.router)
+api_router.include_router(bootstrap.router)
 api_router.include_router(dashboard.router)
+api_router.include_router(events.router)
 api_router.include_router(habits.router)
 api_router.include_router(sleep.router)
 api_router.include_router(users.router)
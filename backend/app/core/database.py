@@ -1,15 +1,220 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import time
+from datetime import date
+from typing import Callable
+
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.request_context import get_request_stats, route_label
+
+pool_checkout_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ("pool",)
+)
+session_lifetime = registry.histogram(
+    "db_session_lifetime_seconds",
+    "Time from session creation to close per route",
+    ("route",)
+)
+session_unused = registry.counter(
+    "db_session_unused_total",
+    "Sessions closed without acquiring a connection per route",
+    ("route",)
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait.observe(
+                time.perf_counter() - started, self.logging_name or "primary"
+            )
+
+
+def _engine_options(url: str, pool_name: str) -> dict:
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_logging_name": pool_name
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS and url.startswith("postgresql"):
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+        }
+    return options
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+def _create_engine(url: str, pool_name: str) -> Engine:
+    return create_engine(url, **_engine_options(url, pool_name))
+
+
+engine = _create_engine(settings.DATABASE_URL, "primary")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+replica_engine = (
+    _create_engine(settings.DATABASE_REPLICA_URL, "replica")
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+ReplicaSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    if replica_engine is not None
+    else None
+)
+
+_primary_pins: dict[int, float] = {}
+_pins_lock = threading.Lock()
+
+
+def _pool_saturation() -> dict[tuple[str, ...], float]:
+    values = {}
+    for name, current in (("primary", engine), ("replica", replica_engine)):
+        if current is None or not isinstance(current.pool, QueuePool):
+            continue
+        capacity = current.pool.size() + max(settings.DB_MAX_OVERFLOW, 0)
+        values[(name,)] = current.pool.checkedout() / capacity if capacity else 0.0
+    return values
+
+
+registry.gauge(
+    "db_pool_saturation_ratio",
+    "Checked out connections divided by pool capacity",
+    ("pool",),
+    callback=_pool_saturation
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = get_request_stats()
+    if stats is not None:
+        stats.record_query(elapsed, statement)
+
+
+@event.listens_for(Session, "after_begin")
+def _mark_connection_used(session: Session, _transaction, _connection) -> None:
+    session.info["connection_used"] = True
+
+
+def run_after_commit(db: Session | None, callback: Callable[[], None]) -> None:
+    if db is None:
+        callback()
+        return
+    db.connection()
+    db.info.setdefault("after_commit", []).append(callback)
 
-def get_db():
-    db = SessionLocal()
+
+@event.listens_for(Session, "after_commit")
+def _run_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop("after_commit", ()):
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_commit_callbacks(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop("after_commit", None)
+
+
+def _route_label(request: Request | None) -> str:
+    if request is None:
+        return "unknown"
+    return route_label(request.scope)
+
+
+def _tracked_session(factory: sessionmaker, request: Request | None, db: Session | None = None):
+    started = time.perf_counter()
+    if db is None:
+        db = factory()
     try:
         yield db
     finally:
         db.close()
+        route = _route_label(request)
+        session_lifetime.observe(time.perf_counter() - started, route)
+        if not db.info.get("connection_used"):
+            session_unused.inc(route)
+
+
+def get_db(request: Request = None):
+    yield from _tracked_session(SessionLocal, request)
+
+
+def pin_to_primary(user_id: int | None, seconds: float | None = None) -> None:
+    if user_id is None or ReplicaSessionLocal is None:
+        return
+    duration = settings.READ_REPLICA_PIN_SECONDS if seconds is None else seconds
+    now = time.monotonic()
+    with _pins_lock:
+        for pinned_id in [key for key, expires_at in _primary_pins.items() if expires_at <= now]:
+            del _primary_pins[pinned_id]
+        _primary_pins[int(user_id)] = now + duration
+
+
+def is_pinned_to_primary(user_id: int | None) -> bool:
+    if user_id is None:
+        return False
+    with _pins_lock:
+        expires_at = _primary_pins.get(user_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            _primary_pins.pop(user_id, None)
+            return False
+        return True
+
+
+def _open_replica_session() -> Session | None:
+    if ReplicaSessionLocal is None:
+        return None
+    db = ReplicaSessionLocal()
+    try:
+        db.connection()
+        return db
+    except OperationalError:
+        db.close()
+        return None
+
+
+def get_read_db(request: Request, primary_db: Session = Depends(get_db)):
+    user_id = getattr(request.state, "user_id", None)
+    replica_db = None if is_pinned_to_primary(user_id) else _open_replica_session()
+    if replica_db is None:
+        yield primary_db
+        return
+    yield from _tracked_session(ReplicaSessionLocal, request, replica_db)
+
+
+def get_history_db(request: Request, primary_db: Session = Depends(get_db)):
+    month = request.query_params.get("month")
+    current_month = date.today().strftime("%Y-%m")
+    if not month or month == current_month:
+        yield primary_db
+        return
+    yield from get_read_db(request, primary_db)
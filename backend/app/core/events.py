@@ -0,0 +1,75 @@
+import asyncio
+import threading
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import run_after_commit
+
+Dispatch = Callable[[int, dict[str, Any]], None]
+
+
+class EventBackend:
+    def start(self, dispatch: Dispatch) -> None:
+        self.dispatch = dispatch
+
+    def publish(self, user_id: int, event: dict[str, Any], db: Session | None = None) -> None:
+        run_after_commit(db, lambda: self.dispatch(user_id, event))
+
+    def stop(self) -> None:
+        return None
+
+
+class EventBus:
+    def __init__(self, backend: EventBackend | None = None, queue_size: int = 100) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+        self.backend = backend or EventBackend()
+        self.backend.start(self._dispatch)
+
+    def set_backend(self, backend: EventBackend) -> None:
+        self.backend.stop()
+        self.backend = backend
+        self.backend.start(self._dispatch)
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if not subscribers:
+                return
+            for item in [item for item in subscribers if item[1] is queue]:
+                subscribers.discard(item)
+            if not subscribers:
+                self._subscribers.pop(user_id, None)
+
+    def has_subscribers(self, user_id: int) -> bool:
+        return user_id in self._subscribers
+
+    def publish(self, user_id: int, event: dict[str, Any], db: Session | None = None) -> None:
+        self.backend.publish(user_id, event, db)
+
+    def _dispatch(self, user_id: int, event: dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                self.unsubscribe(user_id, queue)
+
+
+def _offer(queue: asyncio.Queue, event: dict[str, Any]) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+event_bus = EventBus(queue_size=settings.EVENTS_QUEUE_SIZE)
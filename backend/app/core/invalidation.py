@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import select
+import threading
+import uuid
+from typing import Any, Callable
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.database import engine, pin_to_primary, run_after_commit
+from app.core.events import EventBackend
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str, Any], None]
+
+
+class InvalidationBus:
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, list[Handler]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        with self._lock:
+            self._handlers.setdefault(topic, []).append(handler)
+
+    def publish(self, topic: str, key: Any = None, db: Session | None = None) -> None:
+        message = {"origin": self.origin, "topic": topic, "key": key}
+        if db is None:
+            self._dispatch(topic, key)
+            if self.is_running:
+                self._notify(message)
+            return
+        actor = db.info.get("actor_id")
+        message["actor"] = actor
+        if self.is_running:
+            db.execute(text("SELECT pg_notify(:channel, :payload)"), self._notify_params(message))
+        run_after_commit(db, lambda: self._dispatch(topic, key, actor))
+
+    def _dispatch(self, topic: str, key: Any, actor: int | None = None) -> None:
+        if actor is not None:
+            pin_to_primary(actor)
+        with self._lock:
+            handlers = list(self._handlers.get(topic, ()))
+        for handler in handlers:
+            try:
+                handler(topic, key)
+            except Exception:
+                logger.exception("Invalidation handler failed for topic %s", topic)
+
+    def _notify(self, message: dict) -> None:
+        try:
+            with engine.connect() as connection:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"), self._notify_params(message)
+                )
+                connection.commit()
+        except SQLAlchemyError:
+            logger.warning("Failed to send invalidation for topic %s", message.get("topic"))
+
+    def _notify_params(self, message: dict) -> dict:
+        return {"channel": self.channel, "payload": json.dumps(message, default=str)}
+
+    def _handle_payload(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if message.get("origin") == self.origin:
+            return
+        self._dispatch(message.get("topic", ""), message.get("key"), message.get("actor"))
+
+    def _listen(self, database_url: str) -> None:
+        listen_engine = create_engine(database_url, poolclass=NullPool)
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = listen_engine.raw_connection()
+                connection.driver_connection.autocommit = True
+                cursor = connection.cursor()
+                cursor.execute(f'LISTEN "{self.channel}"')
+                driver_connection = connection.driver_connection
+                while not self._stop.is_set():
+                    readable, _, _ = select.select([driver_connection], [], [], 1.0)
+                    if not readable:
+                        continue
+                    driver_connection.poll()
+                    while driver_connection.notifies:
+                        notification = driver_connection.notifies.pop(0)
+                        self._handle_payload(notification.payload)
+            except Exception:
+                logger.warning("Invalidation listener disconnected; retrying", exc_info=True)
+                self._stop.wait(settings.INVALIDATION_RETRY_SECONDS)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+        listen_engine.dispose()
+
+    def start(self, database_url: str | None = None) -> None:
+        if self.is_running:
+            return
+        url = database_url or settings.DATABASE_URL
+        if not url.startswith("postgresql"):
+            return
+        if make_url(url).get_driver_name() != "psycopg2":
+            logger.warning("Invalidation listener requires the psycopg2 driver; not started")
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, args=(url,), name="invalidation-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+class InvalidationEventBackend(EventBackend):
+    topic = "events"
+
+    def __init__(self, bus: InvalidationBus) -> None:
+        self.bus = bus
+
+    def start(self, dispatch) -> None:
+        super().start(dispatch)
+        self.bus.subscribe(self.topic, self._receive)
+
+    def publish(self, user_id: int, event: dict[str, Any], db: Session | None = None) -> None:
+        self.bus.publish(self.topic, {"userId": user_id, "event": event}, db)
+
+    def _receive(self, _topic: str, key: Any) -> None:
+        if isinstance(key, dict) and "userId" in key:
+            self.dispatch(int(key["userId"]), key.get("event", {}))
+
+
+invalidation_bus = InvalidationBus(settings.INVALIDATION_CHANNEL)
@@ -1,23 +1,170 @@
+import atexit
+import json
 import logging
 import os
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, RotatingFileHandler
+
+from app.core.config import settings
+from app.core.metrics import registry
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), "..", "logs")
 AUTH_LOG_PATH = os.path.join(LOG_DIR, "auth", "auth.log")
 
+auth_log_dropped = registry.counter(
+    "auth_log_dropped_total", "Auth audit records dropped because the log queue was full"
+)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "event": record.getMessage()
+        }
+        payload.update(getattr(record, "fields", {}))
+        return json.dumps(payload, default=str)
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        if not records:
+            return
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            encoding = self.encoding or "utf-8"
+            size = self.stream.tell()
+            chunk: list[str] = []
+            for record in records:
+                line = self.format(record) + self.terminator
+                line_bytes = len(line.encode(encoding))
+                if self.maxBytes > 0 and size and size + line_bytes >= self.maxBytes:
+                    self.stream.write("".join(chunk))
+                    chunk = []
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    size = 0
+                chunk.append(line)
+                size += line_bytes
+            self.stream.write("".join(chunk))
+            self.stream.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+class DroppingQueueHandler(QueueHandler):
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            auth_log_dropped.inc()
+
+
+class BatchingLogWriter:
+    _sentinel = None
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler, batch_size: int = 100):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = max(1, batch_size)
+        self._thread: threading.Thread | None = None
+
+    def _next_batch(self) -> tuple[list[logging.LogRecord], bool]:
+        batch: list[logging.LogRecord] = []
+        record = self.queue.get()
+        while True:
+            if record is self._sentinel:
+                return batch, True
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            if hasattr(handler, "emit_batch"):
+                handler.emit_batch(
+                    [record for record in records if record.levelno >= handler.level]
+                )
+            else:
+                for record in records:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+    def _run(self) -> None:
+        while True:
+            batch, stopped = self._next_batch()
+            if batch:
+                self.handle_batch(batch)
+            if stopped:
+                return
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="auth-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.queue.put(self._sentinel)
+        self._thread.join()
+        self._thread = None
+
+
+_auth_listener: BatchingLogWriter | None = None
+
+
+def _stop_auth_listener() -> None:
+    global _auth_listener
+    if _auth_listener is not None:
+        _auth_listener.stop()
+        _auth_listener = None
+
 
 def setup_logging() -> None:
+    global _auth_listener
     os.makedirs(os.path.dirname(AUTH_LOG_PATH), exist_ok=True)
 
+    profile_logger = logging.getLogger("profiler")
+    if settings.QUERY_PROFILE_DEBUG and not profile_logger.handlers:
+        profile_logger.setLevel(logging.INFO)
+        profile_handler = logging.StreamHandler()
+        profile_handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+        profile_logger.addHandler(profile_handler)
+
     auth_logger = logging.getLogger("auth")
     auth_logger.setLevel(logging.INFO)
+    auth_logger.propagate = False
+
+    if any(isinstance(handler, QueueHandler) for handler in auth_logger.handlers):
+        return
+
+    file_handler = BatchRotatingFileHandler(
+        AUTH_LOG_PATH,
+        maxBytes=settings.AUTH_LOG_MAX_BYTES,
+        backupCount=settings.AUTH_LOG_BACKUP_COUNT,
+        delay=True
+    )
+    file_handler.setFormatter(JsonFormatter())
 
-    if not any(isinstance(handler, logging.FileHandler) for handler in auth_logger.handlers):
-        handler = logging.FileHandler(AUTH_LOG_PATH)
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(message)s"
-        )
-        handler.setFormatter(formatter)
-        auth_logger.addHandler(handler)
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.AUTH_LOG_QUEUE_SIZE)
+    auth_logger.addHandler(DroppingQueueHandler(log_queue))
+    _auth_listener = BatchingLogWriter(
+        log_queue, file_handler, batch_size=settings.AUTH_LOG_BATCH_SIZE
+    )
+    _auth_listener.start()
+    atexit.register(_stop_auth_listener)
 
 
 def get_auth_logger() -> logging.Logger:
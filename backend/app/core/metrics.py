@@ -0,0 +1,215 @@
+import functools
+import threading
+import time
+from typing import Callable
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.description = description
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: tuple[str, ...]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(label) for label in labels)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, description, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def snapshot(self) -> dict[tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        callback: Callable[[], dict[tuple[str, ...], float]] | None = None
+    ) -> None:
+        super().__init__(name, description, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self.callback = callback
+
+    def set(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def snapshot(self) -> dict[tuple[str, ...], float]:
+        if self.callback is not None:
+            return self.callback()
+        with self._lock:
+            return dict(self._values)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [[0] * len(self.buckets), 0, 0.0]
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += 1
+            state[2] += value
+
+    def snapshot(self) -> dict[tuple[str, ...], dict]:
+        with self._lock:
+            result = {}
+            for key, (counts, total, value_sum) in self._values.items():
+                cumulative = []
+                running = 0
+                for count in counts:
+                    running += count
+                    cumulative.append(running)
+                result[key] = {"buckets": cumulative, "count": total, "sum": value_sum}
+            return result
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, description, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        callback: Callable[[], dict[tuple[str, ...], float]] | None = None
+    ) -> Gauge:
+        return self.register(Gauge(name, description, labelnames, callback))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, description, labelnames, buckets))
+
+    def metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+
+registry = MetricsRegistry()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus(metrics_registry: MetricsRegistry | None = None) -> str:
+    lines = []
+    for metric in (metrics_registry or registry).metrics():
+        lines.append(f"# HELP {metric.name} {metric.description}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        snapshot = metric.snapshot()
+        if isinstance(metric, Histogram):
+            for key, state in sorted(snapshot.items()):
+                for bound, count in zip(metric.buckets, state["buckets"]):
+                    labels = _format_labels(metric.labelnames, key, f'le="{_format_value(bound)}"')
+                    lines.append(f"{metric.name}_bucket{labels} {count}")
+                labels = _format_labels(metric.labelnames, key, 'le="+Inf"')
+                lines.append(f"{metric.name}_bucket{labels} {state['count']}")
+                labels = _format_labels(metric.labelnames, key)
+                lines.append(f"{metric.name}_sum{labels} {_format_value(state['sum'])}")
+                lines.append(f"{metric.name}_count{labels} {state['count']}")
+            continue
+        for key, value in sorted(snapshot.items()):
+            labels = _format_labels(metric.labelnames, key)
+            lines.append(f"{metric.name}{labels} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+service_duration = registry.histogram(
+    "service_duration_seconds",
+    "Service call duration",
+    ("operation",)
+)
+
+
+def timed(operation: str):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                service_duration.observe(time.perf_counter() - started, operation)
+        return wrapper
+    return decorator
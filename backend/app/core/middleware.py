@@ -0,0 +1,308 @@
+import gzip
+import logging
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.query_budget import BUDGET_MODES, QueryBudgetExceeded, get_query_budget
+from app.core.request_context import RequestStats, current_request_stats, route_label
+
+profile_logger = logging.getLogger("profiler")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route and status",
+    ("method", "route", "status")
+)
+requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled"
+)
+request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "Database queries issued per request",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+)
+request_db_duration = registry.histogram(
+    "http_request_db_duration_seconds",
+    "Database time spent per request",
+    ("route",)
+)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/"
+)
+
+
+def build_security_headers() -> list[tuple[bytes, bytes]]:
+    headers = {
+        "content-security-policy": settings.CSP_POLICY,
+        "x-content-type-options": "nosniff",
+        "x-frame-options": "DENY",
+        "referrer-policy": "no-referrer",
+        "permissions-policy": "geolocation=()"
+    }
+    return [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+
+
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp, headers: list[tuple[bytes, bytes]] | None = None) -> None:
+        self.app = app
+        self.headers = headers if headers is not None else build_security_headers()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                raw_headers = list(message.get("headers", []))
+                present = {name.lower() for name, _ in raw_headers}
+                raw_headers.extend(
+                    header for header in self.headers if header[0] not in present
+                )
+                message["headers"] = raw_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def _accepted_encodings(value: str) -> set[str]:
+    accepted = set()
+    for item in value.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = params.strip().replace(" ", "")
+        if quality in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name)
+    return accepted
+
+
+def _is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    if content_type.startswith("text/event-stream"):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        gzip_level: int | None = None,
+        brotli_quality: int | None = None
+    ) -> None:
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        self.gzip_level = settings.COMPRESSION_GZIP_LEVEL if gzip_level is None else gzip_level
+        self.brotli_quality = (
+            settings.COMPRESSION_BROTLI_QUALITY if brotli_quality is None else brotli_quality
+        )
+
+    def _select_encoding(self, scope: Scope) -> str | None:
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._select_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                passthrough = True
+                if start_message is not None:
+                    await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or not _is_compressible(headers.get("content-type", ""))
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self._compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            start_message["headers"] = headers.raw
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        requests_in_flight.inc()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_flight.dec()
+            current_request_stats.reset(token)
+            route = route_label(scope)
+            request_duration.observe(elapsed, scope["method"], route, str(status_code))
+            request_db_queries.observe(stats.query_count, route)
+            request_db_duration.observe(stats.query_seconds, route)
+
+
+def _server_timing(stats: RequestStats, total_seconds: float) -> bytes:
+    entries = [f'db;dur={stats.query_seconds * 1000:.2f};desc="{stats.query_count} queries"']
+    entries.extend(f"{name};dur={seconds * 1000:.2f}" for name, seconds in stats.spans.items())
+    entries.append(f"total;dur={total_seconds * 1000:.2f}")
+    return ", ".join(entries).encode("latin-1")
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app: ASGIApp, capture_statements: bool | None = None) -> None:
+        self.app = app
+        self.capture_statements = (
+            settings.QUERY_PROFILE_DEBUG if capture_statements is None else capture_statements
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+        stats.capture_statements = self.capture_statements
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", _server_timing(stats, time.perf_counter() - started))
+                )
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if self.capture_statements and stats.queries:
+                profile_logger.info(
+                    "%s %s: %d queries in %.2f ms",
+                    scope["method"],
+                    route_label(scope),
+                    stats.query_count,
+                    stats.query_seconds * 1000
+                )
+                for seconds, statement in stats.slowest_queries(settings.QUERY_PROFILE_TOP_N):
+                    profile_logger.info("%.2f ms | %s", seconds * 1000, " ".join(statement.split()))
+            if token is not None:
+                current_request_stats.reset(token)
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app: ASGIApp, mode: str | None = None) -> None:
+        self.app = app
+        self.mode = mode or settings.QUERY_BUDGET_MODE
+        if self.mode not in BUDGET_MODES:
+            raise ValueError(f"Unknown query budget mode: {self.mode}")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.mode == "off":
+            await self.app(scope, receive, send)
+            return
+
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+
+        def check_budget() -> None:
+            budget = get_query_budget(scope.get("endpoint"))
+            if budget is None or stats.query_count <= budget:
+                return
+            route = f"{scope['method']} {route_label(scope)}"
+            if self.mode == "raise":
+                raise QueryBudgetExceeded(route, budget, stats.query_count)
+            profile_logger.warning(
+                "%s issued %d queries, budget is %d", route, stats.query_count, budget
+            )
+
+        async def send_with_budget(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                check_budget()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_budget)
+        finally:
+            if token is not None:
+                current_request_stats.reset(token)
@@ -0,0 +1,132 @@
+import logging
+import re
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = {
+    "habit_monthly_bits": "month",
+    "sleep_entries": "sleep_date",
+}
+PARTITION_PATTERN = re.compile(r"_y(\d{4})$")
+
+
+def partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+
+def _is_partitioned(connection: Connection, table: str) -> bool:
+    return connection.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table "
+            "JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid "
+            "WHERE pg_class.relname = :table"
+        ),
+        {"table": table}
+    ).first() is not None
+
+
+def partition_years(connection: Connection, table: str) -> list[int]:
+    rows = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table}
+    ).all()
+    years = []
+    for (name,) in rows:
+        match = PARTITION_PATTERN.search(name)
+        if match:
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def _relation_exists(connection: Connection, name: str) -> bool:
+    return connection.execute(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+    ).scalar()
+
+
+def _attach_year(connection: Connection, table: str, column: str, year: int) -> bool:
+    name = partition_name(table, year)
+    if _relation_exists(connection, name):
+        logger.warning("Skipping partition %s: a relation with that name already exists", name)
+        return False
+    lower = f"'{year}-01-01'"
+    upper = f"'{year + 1}-01-01'"
+    connection.execute(text(f"SET LOCAL lock_timeout = {int(settings.PARTITION_LOCK_TIMEOUT_MS)}"))
+    connection.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    connection.execute(
+        text(
+            f"ALTER TABLE {name} ADD CONSTRAINT {name}_range "
+            f"CHECK ({column} >= {lower} AND {column} < {upper})"
+        )
+    )
+    connection.execute(
+        text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ({lower}) TO ({upper})")
+    )
+    connection.execute(text(f"ALTER TABLE {name} DROP CONSTRAINT {name}_range"))
+    return True
+
+
+def ensure_partitions(
+    bind: Engine = engine, years_ahead: Optional[int] = None, today: Optional[date] = None
+) -> list[str]:
+    if bind.dialect.name != "postgresql":
+        return []
+    years_ahead = settings.PARTITION_YEARS_AHEAD if years_ahead is None else years_ahead
+    current_year = (today or date.today()).year
+    created = []
+    for table, column in PARTITIONED_TABLES.items():
+        with bind.begin() as connection:
+            if not _is_partitioned(connection, table):
+                continue
+            existing = set(partition_years(connection, table))
+        for year in range(current_year, current_year + years_ahead + 1):
+            if year in existing:
+                continue
+            with bind.begin() as connection:
+                attached = _attach_year(connection, table, column, year)
+            if attached:
+                created.append(partition_name(table, year))
+    return created
+
+
+def ensure_partitions_safely() -> list[str]:
+    try:
+        return ensure_partitions()
+    except DBAPIError:
+        logger.exception("Partition maintenance failed")
+        return []
+
+
+def detach_partitions(
+    before_year: int, bind: Engine = engine, concurrently: bool = True
+) -> list[str]:
+    if bind.dialect.name != "postgresql":
+        return []
+    mode = " CONCURRENTLY" if concurrently else ""
+    detached = []
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f"SET lock_timeout = {int(settings.PARTITION_LOCK_TIMEOUT_MS)}"))
+        for table in PARTITIONED_TABLES:
+            if not _is_partitioned(connection, table):
+                continue
+            for year in partition_years(connection, table):
+                if year >= before_year:
+                    continue
+                name = partition_name(table, year)
+                connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}{mode}"))
+                detached.append(name)
+    return detached
@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+BUDGET_ATTRIBUTE = "__query_budget__"
+BUDGET_MODES = ("off", "warn", "raise")
+
+
+class QueryBudgetExceeded(AssertionError):
+    def __init__(self, route: str, budget: int, count: int) -> None:
+        super().__init__(f"{route} issued {count} queries, budget is {budget}")
+        self.route = route
+        self.budget = budget
+        self.count = count
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        self.statements: list[str] = []
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.statements.clear()
+
+
+@contextmanager
+def count_queries(target: Any = Engine) -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter.record(statement)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        setattr(func, BUDGET_ATTRIBUTE, limit)
+        return func
+    return decorator
+
+
+def get_query_budget(endpoint: Any) -> Optional[int]:
+    return getattr(endpoint, BUDGET_ATTRIBUTE, None)
@@ -0,0 +1,70 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from app.core.config import settings
+
+
+class RateLimitBackend(ABC):
+    @abstractmethod
+    def take(self, key: str, capacity: float, rate: float, now: float) -> float:
+        ...
+
+    @abstractmethod
+    def refund(self, key: str, capacity: float) -> None:
+        ...
+
+    def reset(self) -> None:
+        return None
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self, max_keys: int = 100000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: float, rate: float, now: float) -> float:
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + max(now - updated, 0.0) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / rate if rate > 0 else float("inf")
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+    def refund(self, key: str, capacity: float) -> None:
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated = self._buckets[key]
+                self._buckets[key] = (min(capacity, tokens + 1), updated)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend | None = None) -> None:
+        self.backend = backend or MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+    def set_backend(self, backend: RateLimitBackend) -> None:
+        self.backend = backend
+
+    def hit(self, key: str, per_minute: float, burst: float) -> float:
+        return self.backend.take(key, burst, per_minute / 60, time.time())
+
+    def refund(self, key: str, burst: float) -> None:
+        self.backend.refund(key, burst)
+
+    def reset(self) -> None:
+        self.backend.reset()
+
+
+login_limiter = RateLimiter()
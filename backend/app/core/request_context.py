@@ -0,0 +1,51 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+
+class RequestStats:
+    def __init__(self, capture_statements: bool = False) -> None:
+        self.query_count = 0
+        self.query_seconds = 0.0
+        self.capture_statements = capture_statements
+        self.queries: list[tuple[float, str]] = []
+        self.spans: dict[str, float] = {}
+
+    def record_query(self, seconds: float, statement: str | None = None) -> None:
+        self.query_count += 1
+        self.query_seconds += seconds
+        if self.capture_statements and statement is not None:
+            self.queries.append((seconds, statement))
+
+    def record_span(self, name: str, seconds: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    def slowest_queries(self, limit: int) -> list[tuple[float, str]]:
+        return sorted(self.queries, key=lambda item: item[0], reverse=True)[:limit]
+
+
+current_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "current_request_stats", default=None
+)
+
+
+def get_request_stats() -> RequestStats | None:
+    return current_request_stats.get()
+
+
+def route_label(scope: dict[str, Any]) -> str:
+    return getattr(scope.get("route"), "path_format", None) or "unmatched"
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    stats = current_request_stats.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.record_span(name, time.perf_counter() - started)
@@ -1,12 +1,22 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
-from jose import jwt
+from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=settings.PASSWORD_HASH_ROUNDS
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -17,6 +27,10 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_update(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(
     subject: str,
     expires_delta: Optional[timedelta] = None,
@@ -30,3 +44,62 @@ def create_access_token(
     if token_version is not None:
         to_encode["ver"] = token_version
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+class TokenClaims(NamedTuple):
+    user_id: int
+    token_version: int
+    expires_at: float
+
+
+class TokenCache:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, TokenClaims] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes, now: float) -> Optional[TokenClaims]:
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is None:
+                return None
+            if claims.expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key: bytes, claims: TokenClaims) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE)
+
+
+def decode_access_token(token: str) -> TokenClaims:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    now = time.time()
+    claims = token_cache.get(key, now)
+    if claims is not None:
+        return claims
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    subject = payload.get("sub")
+    if subject is None:
+        raise JWTError("Missing subject")
+    claims = TokenClaims(int(subject), int(payload.get("ver", 0)), float(payload.get("exp") or 0))
+    if claims.expires_at > now:
+        token_cache.put(key, claims)
+    return claims
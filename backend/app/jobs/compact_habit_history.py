@@ -0,0 +1,40 @@
+import argparse
+import json
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.services import archive_service, habit_service
+
+
+def vacuum() -> None:
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM (ANALYZE) habit_monthly_bits"))
+        connection.execute(text("ANALYZE habit_yearly_bits"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fold closed habit months into packed per-habit yearly rows."
+    )
+    parser.add_argument(
+        "--before",
+        help="Archive months before YYYY-MM (default: HABIT_ARCHIVE_AFTER_MONTHS ago)"
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.HABIT_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--vacuum", action="store_true")
+    args = parser.parse_args()
+
+    before = habit_service.parse_month(args.before) if args.before else None
+    with SessionLocal() as db:
+        stats = archive_service.compact_closed_months(db, before, args.batch_size)
+    if args.vacuum:
+        vacuum()
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import argparse
+import json
+from datetime import date
+
+from app.core.partitions import detach_partitions, ensure_partitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain yearly history partitions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ensure_parser = commands.add_parser("ensure", help="Create partitions for upcoming years.")
+    ensure_parser.add_argument("--years-ahead", type=int)
+
+    detach_parser = commands.add_parser(
+        "detach", help="Detach partitions older than a year so they can be archived."
+    )
+    detach_parser.add_argument("--before-year", type=int, default=date.today().year - 2)
+    detach_parser.add_argument("--blocking", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "ensure":
+        result = {"created": ensure_partitions(years_ahead=args.years_ahead)}
+    else:
+        result = {
+            "detached": detach_partitions(args.before_year, concurrently=not args.blocking)
+        }
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import argparse
+import json
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services import retention_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Hard-delete habits and users soft-deleted more than RETENTION_DAYS ago."
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.RETENTION_BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=settings.RETENTION_PAUSE_SECONDS)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        if args.dry_run:
+            stats = retention_service.pending_purge(db)
+        else:
+            stats = retention_service.purge_deleted(db, args.batch_size, args.pause)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
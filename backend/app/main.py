@@ -1,15 +1,44 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.events import event_bus
+from app.core.invalidation import InvalidationEventBackend, invalidation_bus
 from app.core.logger import setup_logging
+from app.core.partitions import ensure_partitions_safely
+from app.core.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    QueryBudgetMiddleware,
+    SecurityHeadersMiddleware,
+    ServerTimingMiddleware
+)
+from app.core.responses import FastJSONResponse
 from app.utils.error_handlers import register_error_handlers
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    if settings.PARTITION_AUTO_CREATE:
+        ensure_partitions_safely()
+    if settings.INVALIDATION_ENABLED:
+        invalidation_bus.start()
+        if invalidation_bus.is_running and not isinstance(event_bus.backend, InvalidationEventBackend):
+            event_bus.set_backend(InvalidationEventBackend(invalidation_bus))
+    yield
+    invalidation_bus.stop()
+
+
 def create_app() -> FastAPI:
     setup_logging()
-    app = FastAPI(title=settings.PROJECT_NAME)
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan
+    )
     origins = [origin.strip() for origin in settings.CORS_ORIGINS.split(",") if origin.strip()]
     allow_all = "*" in origins
     app.add_middleware(
@@ -21,15 +50,15 @@ def create_app() -> FastAPI:
     )
 
     if settings.SECURITY_HEADERS:
-        @app.middleware("http")
-        async def add_security_headers(request, call_next):
-            response = await call_next(request)
-            response.headers.setdefault("Content-Security-Policy", settings.CSP_POLICY)
-            response.headers.setdefault("X-Content-Type-Options", "nosniff")
-            response.headers.setdefault("X-Frame-Options", "DENY")
-            response.headers.setdefault("Referrer-Policy", "no-referrer")
-            response.headers.setdefault("Permissions-Policy", "geolocation=()")
-            return response
+        app.add_middleware(SecurityHeadersMiddleware)
+    if settings.SERVER_TIMING_ENABLED or settings.QUERY_PROFILE_DEBUG:
+        app.add_middleware(ServerTimingMiddleware)
+    if settings.QUERY_BUDGET_MODE != "off":
+        app.add_middleware(QueryBudgetMiddleware)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
 
     app.include_router(api_router, prefix=settings.API_V1_STR)
     register_error_handlers(app)
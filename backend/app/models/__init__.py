@@ -1,7 +1,8 @@
 from app.models.base import Base
 from app.models.habit import Habit
 from app.models.habit_monthly_bits import HabitMonthlyBits
+from app.models.habit_yearly_bits import HabitYearlyBits
 from app.models.sleep_entry import SleepEntry
 from app.models.user import User
 
-__all__ = ["Base", "User", "Habit", "HabitMonthlyBits", "SleepEntry"]
+__all__ = ["Base", "User", "Habit", "HabitMonthlyBits", "HabitYearlyBits", "SleepEntry"]
@@ -1,16 +1,23 @@
-from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.sql import func
 
 from app.models.base import Base
+from app.models.types import BigIntegerPK
 
 
 class Habit(Base):
     __tablename__ = "habits"
 
-    id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String, nullable=False)
     description = Column(String)
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    deleted_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("idx_habits_user_active_id", "user_id", "is_active", "id"),
+        Index("idx_habits_deleted_at", "deleted_at"),
+    )
@@ -1,7 +1,7 @@
-from sqlalchemy import BigInteger, Column, Date, ForeignKey
-from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy import BigInteger, Column, Date, ForeignKey, Index
 
 from app.models.base import Base
+from app.models.types import DayBits
 
 
 class HabitMonthlyBits(Base):
@@ -9,4 +9,8 @@ class HabitMonthlyBits(Base):
 
     habit_id = Column(BigInteger, ForeignKey("habits.id", ondelete="CASCADE"), primary_key=True)
     month = Column(Date, primary_key=True)
-    day_bits = Column(BIT(31), nullable=False)
+    day_bits = Column(DayBits(31), nullable=False)
+
+    __table_args__ = (
+        Index("idx_habit_monthly_bits_month_habit", "month", "habit_id"),
+    )
@@ -0,0 +1,12 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer, LargeBinary
+
+from app.models.base import Base
+
+
+class HabitYearlyBits(Base):
+    __tablename__ = "habit_yearly_bits"
+
+    habit_id = Column(BigInteger, ForeignKey("habits.id", ondelete="CASCADE"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    month_mask = Column(Integer, nullable=False, default=0)
+    day_bits = Column(LargeBinary, nullable=False)
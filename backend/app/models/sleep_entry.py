@@ -2,12 +2,13 @@ from sqlalchemy import BigInteger, Column, Date, DateTime, Float, ForeignKey, In
 from sqlalchemy.sql import func
 
 from app.models.base import Base
+from app.models.types import BigIntegerPK
 
 
 class SleepEntry(Base):
     __tablename__ = "sleep_entries"
 
-    id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     sleep_date = Column(Date, nullable=False, index=True)
     duration_hours = Column(Float, nullable=False)
@@ -17,3 +18,4 @@ class SleepEntry(Base):
     __table_args__ = (
         Index("idx_sleep_entries_user_date", "user_id", "sleep_date", unique=True),
     )
+    __mapper_args__ = {"primary_key": [id, sleep_date]}
@@ -0,0 +1,50 @@
+from sqlalchemy import BigInteger, Integer
+from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+BigIntegerPK = BigInteger().with_variant(Integer(), "sqlite")
+
+
+class DayBits(TypeDecorator):
+    impl = Integer
+    cache_ok = True
+
+    def __init__(self, length: int = 31) -> None:
+        super().__init__()
+        self.length = length
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(BIT(self.length))
+        return dialect.type_descriptor(Integer())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql" or isinstance(value, int):
+            return value
+        bits = "".join(char for char in str(value) if char in ("0", "1"))[:self.length]
+        return int(bits[::-1], 2) if bits else 0
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return format(int(value), f"0{self.length}b")[::-1]
+
+
+class day_mask(FunctionElement):
+    type = Integer()
+    name = "day_mask"
+    inherit_cache = True
+
+
+@compiles(day_mask)
+def _compile_day_mask(element, compiler, **kw):
+    return f"CAST({compiler.process(element.clauses, **kw)} AS INTEGER)"
+
+
+@compiles(day_mask, "postgresql")
+def _compile_day_mask_postgresql(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    length = next(iter(element.clauses)).type.length
+    return f"reverse(CAST({column} AS TEXT))::bit({length})::integer"
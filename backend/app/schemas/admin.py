@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -37,3 +39,18 @@ class AdminReport(BaseModel):
     dailyCounts: list[int]
     topHabits: list[ReportHabit]
     sleepReport: SleepReport
+
+
+class LeaderboardEntry(BaseModel):
+    userId: int
+    name: str
+    rank: int
+    successRate: int
+    streakDays: int
+
+
+class Leaderboard(BaseModel):
+    month: str
+    totalUsers: int
+    top: list[LeaderboardEntry]
+    user: Optional[LeaderboardEntry] = None
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.schemas.dashboard import DashboardResponse
+from app.schemas.habit import HabitsResponse
+from app.schemas.sleep import SleepResponse
+from app.schemas.user import UserProfile
+
+
+class BootstrapResponse(BaseModel):
+    user: Optional[UserProfile] = None
+    dashboard: Optional[DashboardResponse] = None
+    habits: Optional[HabitsResponse] = None
+    sleep: Optional[SleepResponse] = None
@@ -1,12 +1,14 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class HabitRow(BaseModel):
     id: int
     habit: str
-    days: list[bool]
+    days: list[bool] | int = Field(
+        description="List of booleans, or an integer day mask when encoding is bits-v1"
+    )
 
 
 class HabitsResponse(BaseModel):
@@ -15,6 +17,7 @@ class HabitsResponse(BaseModel):
     days: int
     month: str
     availableMonths: list[str]
+    encoding: Optional[str] = None
 
 
 class HabitCreate(BaseModel):
@@ -1,3 +1,19 @@
-from app.services import auth_service, habit_service, sleep_service, user_service
+from app.services import (
+    archive_service,
+    auth_service,
+    habit_service,
+    leaderboard_service,
+    retention_service,
+    sleep_service,
+    user_service,
+)
 
-__all__ = ["auth_service", "habit_service", "sleep_service", "user_service"]
+__all__ = [
+    "archive_service",
+    "auth_service",
+    "habit_service",
+    "leaderboard_service",
+    "retention_service",
+    "sleep_service",
+    "user_service",
+]
@@ -0,0 +1,73 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.habit_monthly_bits import HabitMonthlyBits
+from app.models.habit_yearly_bits import HabitYearlyBits
+from app.services.habit_service import YEAR_BITS_BYTES, pack_year_bits
+
+
+def archive_cutoff(today: Optional[date] = None) -> date:
+    month = (today or date.today()).replace(day=1)
+    for _ in range(max(settings.HABIT_ARCHIVE_AFTER_MONTHS, 1)):
+        month = (month - timedelta(days=1)).replace(day=1)
+    return month
+
+
+def _next_habit_batch(db: Session, cutoff: date, after_id: int, batch_size: int) -> list[int]:
+    rows = (
+        db.query(HabitMonthlyBits.habit_id)
+        .filter(HabitMonthlyBits.month < cutoff, HabitMonthlyBits.habit_id > after_id)
+        .distinct()
+        .order_by(HabitMonthlyBits.habit_id.asc())
+        .limit(batch_size)
+        .all()
+    )
+    return [row.habit_id for row in rows]
+
+
+def compact_closed_months(
+    db: Session, before: Optional[date] = None, batch_size: Optional[int] = None
+) -> dict:
+    current_month = date.today().replace(day=1)
+    cutoff = min((before or archive_cutoff()).replace(day=1), current_month)
+    batch_size = batch_size or settings.HABIT_ARCHIVE_BATCH_SIZE
+    stats = {"cutoff": cutoff.isoformat(), "habits": 0, "months": 0, "years": 0}
+    last_habit_id = 0
+    while True:
+        habit_ids = _next_habit_batch(db, cutoff, last_habit_id, batch_size)
+        if not habit_ids:
+            return stats
+        last_habit_id = habit_ids[-1]
+        month_filter = (
+            HabitMonthlyBits.habit_id.in_(habit_ids),
+            HabitMonthlyBits.month < cutoff
+        )
+        grouped: dict[tuple[int, int], dict[int, object]] = {}
+        for row in db.query(HabitMonthlyBits).filter(*month_filter).all():
+            grouped.setdefault((row.habit_id, row.month.year), {})[row.month.month] = row.day_bits
+        existing = {
+            (row.habit_id, row.year): row
+            for row in db.query(HabitYearlyBits)
+            .filter(
+                HabitYearlyBits.habit_id.in_(habit_ids),
+                HabitYearlyBits.year.in_({year for _, year in grouped})
+            )
+            .all()
+        }
+        for (habit_id, year), months in grouped.items():
+            record = existing.get((habit_id, year))
+            if record is None:
+                record = HabitYearlyBits(
+                    habit_id=habit_id, year=year, month_mask=0, day_bits=bytes(YEAR_BITS_BYTES)
+                )
+                db.add(record)
+            record.day_bits = pack_year_bits(months, record.day_bits)
+            record.month_mask = (record.month_mask or 0) | sum(1 << (month - 1) for month in months)
+            stats["months"] += len(months)
+        db.query(HabitMonthlyBits).filter(*month_filter).delete(synchronize_session=False)
+        db.commit()
+        stats["habits"] += len(habit_ids)
+        stats["years"] += len(grouped)
@@ -1,11 +1,11 @@
 from datetime import timedelta
 from typing import Optional, Tuple
 
-from fastapi import Request
+from fastapi import BackgroundTasks, Request
 
 from app.core.config import settings
 from app.core.logger import get_auth_logger
-from app.core.security import create_access_token
+from app.core.security import create_access_token, password_needs_update
 from sqlalchemy.orm import Session
 
 from app.services import user_service
@@ -16,20 +16,33 @@ def _log_auth_event(event: str, email: str, request: Request, success: bool) ->
     ip_address = request.client.host if request.client else "unknown"
     user_agent = request.headers.get("user-agent", "unknown")
     logger.info(
-        "%s | %s | success=%s | ip=%s | agent=%s",
         event,
-        email,
-        success,
-        ip_address,
-        user_agent
+        extra={
+            "fields": {
+                "email": email,
+                "success": success,
+                "ip": ip_address,
+                "agent": user_agent
+            }
+        }
     )
 
 
-def login(db: Session, email: str, password: str, request: Request) -> Optional[Tuple[str, bool]]:
+def login(
+    db: Session,
+    email: str,
+    password: str,
+    request: Request,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> Optional[Tuple[str, bool]]:
     user = user_service.authenticate(db, email, password)
     if not user:
         _log_auth_event("login_failed", email, request, False)
         return None
+    if background_tasks is not None and password_needs_update(user.password_hash):
+        background_tasks.add_task(
+            user_service.upgrade_password_hash, db.get_bind(), user.id, password, user.password_hash
+        )
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     token = create_access_token(
         subject=str(user.id),
@@ -1,16 +1,32 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import calendar
 from typing import Optional
 
+from sqlalchemy import Date, Integer, cast, func, null, or_, select, union
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.events import event_bus
+from app.core.invalidation import invalidation_bus
+from app.core.metrics import timed
+from app.core.request_context import span
 from app.models.habit import Habit
 from app.models.habit_monthly_bits import HabitMonthlyBits
+from app.models.habit_yearly_bits import HabitYearlyBits
+from app.models.types import day_mask
 from app.models.user import User
 
 DAYS = min(settings.TRACK_WINDOW_DAYS, 31)
 STREAK_TARGET = 0.8
+BOOL_ENCODING = "bool"
+BITS_ENCODING = "bits-v1"
+ENCODINGS = {"bool": BOOL_ENCODING, "bits": BITS_ENCODING, "bits-v1": BITS_ENCODING}
+HABITS_FIELDS = ("habits", "habitMatrix", "days", "month", "availableMonths")
+DASHBOARD_FIELDS = ("stats", "progressBars", "dailyCounts", "successRate", "month", "availableMonths")
+DASHBOARD_MATRIX_FIELDS = {"stats", "dailyCounts", "successRate"}
+MONTH_SLOT_BITS = 31
+MONTH_SLOT_MASK = (1 << MONTH_SLOT_BITS) - 1
+YEAR_BITS_BYTES = (12 * MONTH_SLOT_BITS + 7) // 8
 
 progress_bars = [
     {"label": "Hydration", "value": 78},
@@ -39,6 +55,14 @@ def parse_month(value: Optional[str]) -> date:
     return _parse_month(value)
 
 
+def parse_encoding(value: Optional[str]) -> str:
+    if not value:
+        return BOOL_ENCODING
+    if value not in ENCODINGS:
+        raise ValueError(f"Unsupported encoding: {value}")
+    return ENCODINGS[value]
+
+
 def month_days(value: date) -> int:
     return _month_days(value)
 
@@ -47,7 +71,7 @@ def _month_days(value: date) -> int:
     return calendar.monthrange(value.year, value.month)[1]
 
 
-def _bits_to_list(bits_value: Optional[object]) -> list[bool]:
+def _normalize_bits(bits_value: Optional[object]) -> str:
     if bits_value is None:
         bits_str = ""
     elif isinstance(bits_value, memoryview):
@@ -57,8 +81,19 @@ def _bits_to_list(bits_value: Optional[object]) -> list[bool]:
     else:
         bits_str = str(bits_value)
     bits_str = bits_str.strip()
-    normalized = "".join(char for char in bits_str if char in ("0", "1")).ljust(31, "0")[:31]
-    return [char == "1" for char in normalized]
+    return "".join(char for char in bits_str if char in ("0", "1")).ljust(31, "0")[:31]
+
+
+def _bits_to_list(bits_value: Optional[object]) -> list[bool]:
+    return [char == "1" for char in _normalize_bits(bits_value)]
+
+
+def bits_to_list(bits_value: Optional[object]) -> list[bool]:
+    return _bits_to_list(bits_value)
+
+
+def _bits_to_mask(bits_value: Optional[object]) -> int:
+    return int(_normalize_bits(bits_value)[::-1], 2)
 
 
 def _list_to_bits(values: list[bool]) -> str:
@@ -66,6 +101,27 @@ def _list_to_bits(values: list[bool]) -> str:
     return bits.ljust(31, "0")
 
 
+def pack_year_bits(months: dict[int, object], existing: Optional[bytes] = None) -> bytes:
+    value = int.from_bytes(bytes(existing), "little") if existing else 0
+    for month, bits in months.items():
+        shift = (month - 1) * MONTH_SLOT_BITS
+        value = (value & ~(MONTH_SLOT_MASK << shift)) | (_bits_to_mask(bits) << shift)
+    return value.to_bytes(YEAR_BITS_BYTES, "little")
+
+
+def unpack_month_mask(data: bytes, month: int) -> int:
+    value = int.from_bytes(bytes(data), "little") >> ((month - 1) * MONTH_SLOT_BITS)
+    return value & MONTH_SLOT_MASK
+
+
+def unpack_month_bits(data: bytes, month: int) -> str:
+    return format(unpack_month_mask(data, month), f"0{MONTH_SLOT_BITS}b")[::-1]
+
+
+def _month_flag(month: date) -> int:
+    return 1 << (month.month - 1)
+
+
 def _get_window_dates() -> list[date]:
     end_date = date.today()
     start_date = end_date - timedelta(days=DAYS - 1)
@@ -73,16 +129,59 @@ def _get_window_dates() -> list[date]:
 
 
 def _load_month_bits(
+    db: Session, habit_ids: list[int], months: list[date], parse=_bits_to_list
+) -> dict[tuple[int, date], object]:
+    if not habit_ids or not months:
+        return {}
+    with span("bits_query"):
+        rows = (
+            db.query(HabitMonthlyBits)
+            .filter(HabitMonthlyBits.habit_id.in_(habit_ids), HabitMonthlyBits.month.in_(months))
+            .all()
+        )
+        archived = _load_archived_bits(db, habit_ids, months)
+    with span("bits_parse"):
+        bits_map = {key: parse(bits) for key, bits in archived.items()}
+        bits_map.update({(row.habit_id, row.month): parse(row.day_bits) for row in rows})
+        return bits_map
+
+
+def _load_month_masks(
     db: Session, habit_ids: list[int], months: list[date]
-) -> dict[tuple[int, date], list[bool]]:
+) -> dict[tuple[int, date], int]:
     if not habit_ids or not months:
         return {}
+    with span("bits_query"):
+        rows = db.execute(
+            select(HabitMonthlyBits.habit_id, HabitMonthlyBits.month, day_mask(HabitMonthlyBits.day_bits))
+            .where(HabitMonthlyBits.habit_id.in_(habit_ids), HabitMonthlyBits.month.in_(months))
+        ).all()
+        mask_map = _load_archived_bits(db, habit_ids, months, unpack=unpack_month_mask)
+    mask_map.update({(habit_id, month): mask or 0 for habit_id, month, mask in rows})
+    return mask_map
+
+
+def _load_archived_bits(
+    db: Session, habit_ids: list[int], months: list[date], unpack=unpack_month_bits
+) -> dict[tuple[int, date], object]:
+    current_month = _month_start(date.today())
+    past_months = [month for month in months if month < current_month]
+    if not past_months:
+        return {}
     rows = (
-        db.query(HabitMonthlyBits)
-        .filter(HabitMonthlyBits.habit_id.in_(habit_ids), HabitMonthlyBits.month.in_(months))
+        db.query(HabitYearlyBits)
+        .filter(
+            HabitYearlyBits.habit_id.in_(habit_ids),
+            HabitYearlyBits.year.in_({month.year for month in past_months})
+        )
         .all()
     )
-    return {(row.habit_id, row.month): _bits_to_list(row.day_bits) for row in rows}
+    archived = {}
+    for row in rows:
+        for month in past_months:
+            if month.year == row.year and row.month_mask & _month_flag(month):
+                archived[(row.habit_id, month)] = unpack(row.day_bits, month.month)
+    return archived
 
 
 def _build_habit_matrix(
@@ -120,6 +219,19 @@ def _build_month_matrix(
     return habit_matrix
 
 
+def _build_month_mask_matrix(
+    habits: list[Habit],
+    mask_map: dict[tuple[int, date], int],
+    month_key: date,
+    day_count: int
+) -> list[dict]:
+    day_mask = (1 << day_count) - 1
+    return [
+        {"id": habit.id, "habit": habit.name, "days": mask_map.get((habit.id, month_key), 0) & day_mask}
+        for habit in habits
+    ]
+
+
 def _get_daily_counts(matrix: list[dict], day_count: int) -> tuple[list[int], int]:
     counts = [0] * day_count
     completed = 0
@@ -152,14 +264,28 @@ def _calculate_success_trend(daily_counts: list[int], habit_count: int) -> str:
 
 
 def _get_available_months(db: Session, user_id: int) -> list[str]:
-    month_rows = (
-        db.query(HabitMonthlyBits.month)
+    live = (
+        select(
+            HabitMonthlyBits.month,
+            cast(null(), Integer).label("year"),
+            cast(null(), Integer).label("month_mask")
+        )
         .join(Habit, Habit.id == HabitMonthlyBits.habit_id)
-        .filter(Habit.user_id == user_id)
-        .distinct()
-        .all()
+        .where(Habit.user_id == user_id)
+    )
+    archived = (
+        select(cast(null(), Date), HabitYearlyBits.year, HabitYearlyBits.month_mask)
+        .join(Habit, Habit.id == HabitYearlyBits.habit_id)
+        .where(Habit.user_id == user_id)
     )
-    months = {_month_start(row.month) for row in month_rows}
+    months = set()
+    for month, year, month_mask in db.execute(union(live, archived)).all():
+        if month is not None:
+            months.add(_month_start(month))
+            continue
+        months.update(
+            date(year, index + 1, 1) for index in range(12) if month_mask & (1 << index)
+        )
     months.add(_month_start(date.today()))
     return [_format_month(value) for value in sorted(months, reverse=True)]
 
@@ -174,9 +300,10 @@ def _ensure_month_tracking(db: Session, habits: list[Habit], month_key: date) ->
         .all()
     )
     existing_ids = {row.habit_id for row in existing}
-    for habit_id in habit_ids:
-        if habit_id in existing_ids:
-            continue
+    missing_ids = [habit_id for habit_id in habit_ids if habit_id not in existing_ids]
+    if not missing_ids:
+        return
+    for habit_id in missing_ids:
         db.add(HabitMonthlyBits(habit_id=habit_id, month=month_key, day_bits="0" * 31))
     db.commit()
 
@@ -189,53 +316,119 @@ def _get_month_habits(db: Session, user_id: int, month_key: date, is_current: bo
             .order_by(Habit.id.asc())
             .all()
         )
-        _ensure_month_tracking(db, habits, month_key)
+        with span("ensure_month"):
+            _ensure_month_tracking(db, habits, month_key)
         return habits
+    live_ids = select(HabitMonthlyBits.habit_id).where(HabitMonthlyBits.month == month_key)
+    archived_ids = select(HabitYearlyBits.habit_id).where(
+        HabitYearlyBits.year == month_key.year,
+        HabitYearlyBits.month_mask.op("&")(_month_flag(month_key)) != 0
+    )
     return (
         db.query(Habit)
-        .join(HabitMonthlyBits, HabitMonthlyBits.habit_id == Habit.id)
-        .filter(Habit.user_id == user_id, HabitMonthlyBits.month == month_key)
+        .filter(Habit.user_id == user_id, or_(Habit.id.in_(live_ids), Habit.id.in_(archived_ids)))
         .order_by(Habit.id.asc())
         .all()
     )
 
 
-def list_habits(db: Session, user_id: int, month: Optional[date] = None) -> dict:
+@timed("list_habits")
+def list_habits(
+    db: Session,
+    user_id: int,
+    month: Optional[date] = None,
+    encoding: str = BOOL_ENCODING,
+    fields: Optional[set[str]] = None
+) -> dict:
+    fields = fields or set(HABITS_FIELDS)
     month_key = _month_start(month or date.today())
     is_current = month_key == _month_start(date.today())
-    habits = _get_month_habits(db, user_id, month_key, is_current)
     day_count = _month_days(month_key)
-    bits_map = _load_month_bits(db, [habit.id for habit in habits], [month_key])
-    habit_matrix = _build_month_matrix(habits, bits_map, month_key, day_count)
-    return {
+    habits: list[Habit] = []
+    habit_matrix: list[dict] = []
+    if "habits" in fields or "habitMatrix" in fields:
+        habits = _get_month_habits(db, user_id, month_key, is_current)
+    if "habitMatrix" in fields:
+        habit_ids = [habit.id for habit in habits]
+        if encoding == BITS_ENCODING:
+            mask_map = _load_month_masks(db, habit_ids, [month_key])
+            habit_matrix = _build_month_mask_matrix(habits, mask_map, month_key, day_count)
+        else:
+            bits_map = _load_month_bits(db, habit_ids, [month_key])
+            habit_matrix = _build_month_matrix(habits, bits_map, month_key, day_count)
+    available_months = (
+        _get_available_months(db, user_id) if "availableMonths" in fields else []
+    )
+    data = _build_habits_payload(
+        habits, habit_matrix, month_key, day_count, available_months, fields
+    )
+    if encoding != BOOL_ENCODING and "habitMatrix" in fields:
+        data["encoding"] = encoding
+    return data
+
+
+def _build_habits_payload(
+    habits: list[Habit],
+    habit_matrix: list[dict],
+    month_key: date,
+    day_count: int,
+    available_months: list[str],
+    fields: Optional[set[str]] = None
+) -> dict:
+    payload = {
         "habits": [habit.name for habit in habits],
         "habitMatrix": habit_matrix,
         "days": day_count,
         "month": _format_month(month_key),
-        "availableMonths": _get_available_months(db, user_id)
+        "availableMonths": available_months
     }
+    if fields is None:
+        return payload
+    return {key: value for key, value in payload.items() if key in fields}
 
 
-def add_habit(db: Session, user_id: int, name: str) -> dict:
+def add_habit(
+    db: Session,
+    user_id: int,
+    name: str,
+    encoding: str = BOOL_ENCODING,
+    client_id: Optional[str] = None
+) -> dict:
     habit = Habit(user_id=user_id, name=name, is_active=True)
     db.add(habit)
     db.commit()
     db.refresh(habit)
     month_key = _month_start(date.today())
     db.add(HabitMonthlyBits(habit_id=habit.id, month=month_key, day_bits="0" * 31))
+    invalidation_bus.publish("habits", user_id, db)
+    invalidation_bus.publish("leaderboard", user_id, db)
+    event_bus.publish(
+        user_id,
+        {
+            "type": "habit.added",
+            "habitId": habit.id,
+            "name": habit.name,
+            "month": _format_month(month_key),
+            "clientId": client_id
+        },
+        db
+    )
     db.commit()
-    data = list_habits(db, user_id, month_key)
+    data = list_habits(db, user_id, month_key, encoding)
     new_row = next((row for row in data["habitMatrix"] if row["id"] == habit.id), None)
     return {"habitMatrix": data["habitMatrix"], "habit": new_row}
 
 
+@timed("toggle_habit")
 def toggle_habit(
     db: Session,
     user_id: int,
     habit_id: int,
     day_index: int,
     done: Optional[bool],
-    month: Optional[date]
+    month: Optional[date],
+    encoding: str = BOOL_ENCODING,
+    client_id: Optional[str] = None
 ) -> Optional[dict]:
     month_key = _month_start(month or date.today())
     if month_key != _month_start(date.today()):
@@ -260,23 +453,90 @@ def toggle_habit(
         db.add(record)
     bits = _bits_to_list(record.day_bits)
     bit_index = day_index
+    previous = bits[bit_index]
     if done is None:
         bits[bit_index] = not bits[bit_index]
     else:
         bits[bit_index] = done
     record.day_bits = _list_to_bits(bits)
+    invalidation_bus.publish("habits", user_id, db)
+    if bits[bit_index] != previous:
+        invalidation_bus.publish(
+            "leaderboard",
+            {
+                "userId": user_id,
+                "month": month_key.isoformat(),
+                "dayIndex": day_index,
+                "delta": 1 if bits[bit_index] else -1
+            },
+            db
+        )
+    event_bus.publish(
+        user_id,
+        {
+            "type": "habit.toggled",
+            "habitId": habit_id,
+            "month": _format_month(month_key),
+            "dayIndex": day_index,
+            "done": bits[bit_index],
+            "clientId": client_id
+        },
+        db
+    )
     db.commit()
-    data = list_habits(db, user_id, month_key)
+    data = list_habits(db, user_id, month_key, encoding)
     return {"habitMatrix": data["habitMatrix"]}
 
 
-def get_dashboard(db: Session, user_id: int, month: Optional[date] = None) -> dict:
+@timed("get_dashboard")
+def get_dashboard(
+    db: Session, user_id: int, month: Optional[date] = None, fields: Optional[set[str]] = None
+) -> dict:
+    fields = fields or set(DASHBOARD_FIELDS)
+    month_key = _month_start(month or date.today())
+    is_current = month_key == _month_start(date.today())
+    day_count = _month_days(month_key)
+    habit_matrix: list[dict] = []
+    if fields & DASHBOARD_MATRIX_FIELDS:
+        habits = _get_month_habits(db, user_id, month_key, is_current)
+        bits_map = _load_month_bits(db, [habit.id for habit in habits], [month_key])
+        habit_matrix = _build_month_matrix(habits, bits_map, month_key, day_count)
+    available_months = (
+        _get_available_months(db, user_id) if "availableMonths" in fields else []
+    )
+    return _build_dashboard_payload(
+        db, habit_matrix, month_key, day_count, is_current, available_months, fields
+    )
+
+
+def get_month_overview(db: Session, user_id: int, month: Optional[date] = None) -> dict:
     month_key = _month_start(month or date.today())
     is_current = month_key == _month_start(date.today())
     habits = _get_month_habits(db, user_id, month_key, is_current)
     day_count = _month_days(month_key)
     bits_map = _load_month_bits(db, [habit.id for habit in habits], [month_key])
     habit_matrix = _build_month_matrix(habits, bits_map, month_key, day_count)
+    available_months = _get_available_months(db, user_id)
+    return {
+        "dashboard": _build_dashboard_payload(
+            db, habit_matrix, month_key, day_count, is_current, available_months
+        ),
+        "habits": _build_habits_payload(
+            habits, habit_matrix, month_key, day_count, available_months
+        )
+    }
+
+
+def _build_dashboard_payload(
+    db: Session,
+    habit_matrix: list[dict],
+    month_key: date,
+    day_count: int,
+    is_current: bool,
+    available_months: list[str],
+    fields: Optional[set[str]] = None
+) -> dict:
+    fields = fields or set(DASHBOARD_FIELDS)
     daily_counts, completed = _get_daily_counts(habit_matrix, day_count)
     if is_current and daily_counts:
         current_day = min(date.today().day, day_count)
@@ -286,50 +546,66 @@ def get_dashboard(db: Session, user_id: int, month: Optional[date] = None) -> di
     total_habits = len(habit_matrix)
     total_slots = total_habits * len(effective_counts)
     success_rate = round((sum(effective_counts) / total_slots) * 100) if total_slots else 0
-    success_trend = _calculate_success_trend(effective_counts, total_habits)
-    if not daily_counts:
-        today_index = 0
-    elif is_current:
-        today_index = min(len(daily_counts) - 1, date.today().day - 1)
-    else:
-        today_index = len(daily_counts) - 1
-    completed_habits = daily_counts[today_index] if daily_counts else 0
-    streak_days = 0
-    if total_habits > 0 and effective_counts:
-        for day_index in range(len(effective_counts) - 1, -1, -1):
-            daily_rate = effective_counts[day_index] / total_habits
-            if daily_rate >= STREAK_TARGET:
-                streak_days += 1
-            else:
-                break
-
-    active_users = db.query(User).filter(User.status == "active").count()
-    total_habits_tracked = db.query(Habit).filter(Habit.is_active.is_(True)).count()
-
-    stats = {
-        "successRate": success_rate,
-        "successTrend": success_trend,
-        "streakDays": streak_days,
-        "completedHabits": completed_habits,
-        "totalHabits": total_habits,
-        "activeUsers": active_users,
-        "totalHabitsTracked": total_habits_tracked
-    }
-    return {
-        "stats": stats,
+    payload = {
         "progressBars": progress_bars,
         "dailyCounts": daily_counts,
         "successRate": success_rate,
         "month": _format_month(month_key),
-        "availableMonths": _get_available_months(db, user_id)
+        "availableMonths": available_months
     }
+    if "stats" in fields:
+        success_trend = _calculate_success_trend(effective_counts, total_habits)
+        if not daily_counts:
+            today_index = 0
+        elif is_current:
+            today_index = min(len(daily_counts) - 1, date.today().day - 1)
+        else:
+            today_index = len(daily_counts) - 1
+        completed_habits = daily_counts[today_index] if daily_counts else 0
+        streak_days = 0
+        if total_habits > 0 and effective_counts:
+            for day_index in range(len(effective_counts) - 1, -1, -1):
+                daily_rate = effective_counts[day_index] / total_habits
+                if daily_rate >= STREAK_TARGET:
+                    streak_days += 1
+                else:
+                    break
+
+        with span("global_counts"):
+            active_users = db.query(User).filter(User.status == "active").count()
+            total_habits_tracked = db.query(Habit).filter(Habit.is_active.is_(True)).count()
+
+        payload["stats"] = {
+            "successRate": success_rate,
+            "successTrend": success_trend,
+            "streakDays": streak_days,
+            "completedHabits": completed_habits,
+            "totalHabits": total_habits,
+            "activeUsers": active_users,
+            "totalHabitsTracked": total_habits_tracked
+        }
+    return {key: payload[key] for key in DASHBOARD_FIELDS if key in fields}
 
 
 def get_habit_count(db: Session, user_id: int) -> int:
     return db.query(Habit).filter(Habit.user_id == user_id, Habit.is_active.is_(True)).count()
 
 
-def delete_habit(db: Session, user_id: int, habit_id: int) -> bool:
+def get_habit_counts(db: Session, user_ids: list[int]) -> dict[int, int]:
+    if not user_ids:
+        return {}
+    rows = (
+        db.query(Habit.user_id, func.count(Habit.id))
+        .filter(Habit.user_id.in_(user_ids), Habit.is_active.is_(True))
+        .group_by(Habit.user_id)
+        .all()
+    )
+    return {user_id: count for user_id, count in rows}
+
+
+def delete_habit(
+    db: Session, user_id: int, habit_id: int, client_id: Optional[str] = None
+) -> bool:
     habit = (
         db.query(Habit)
         .filter(Habit.id == habit_id, Habit.user_id == user_id, Habit.is_active.is_(True))
@@ -338,10 +614,17 @@ def delete_habit(db: Session, user_id: int, habit_id: int) -> bool:
     if not habit:
         return False
     habit.is_active = False
+    habit.deleted_at = datetime.now(timezone.utc)
+    invalidation_bus.publish("habits", user_id, db)
+    invalidation_bus.publish("leaderboard", user_id, db)
+    event_bus.publish(
+        user_id, {"type": "habit.deleted", "habitId": habit_id, "clientId": client_id}, db
+    )
     db.commit()
     return True
 
 
+@timed("get_admin_report")
 def get_admin_report(db: Session, user_ids: list[int]) -> dict:
     if not user_ids:
         return {
@@ -350,6 +633,7 @@ def get_admin_report(db: Session, user_ids: list[int]) -> dict:
             "totalCompleted": 0,
             "totalSlots": 0,
             "successRate": 0,
+            "successTrend": "+0%",
             "dailyCounts": [0] * DAYS,
             "topHabits": []
         }
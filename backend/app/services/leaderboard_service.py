@@ -0,0 +1,235 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.models.habit import Habit
+from app.models.habit_monthly_bits import HabitMonthlyBits
+from app.models.user import User
+from app.services.habit_service import STREAK_TARGET, bits_to_list
+from app.services.user_service import DELETED_STATUS
+
+TOPIC = "leaderboard"
+
+
+def _score(counts: array, habits: int, day: int) -> tuple[int, int]:
+    slots = habits * day
+    if not slots:
+        return 0, 0
+    success_rate = round(sum(counts[:day]) / slots * 100)
+    streak_days = 0
+    for index in range(day - 1, -1, -1):
+        if counts[index] / habits < STREAK_TARGET:
+            break
+        streak_days += 1
+    return success_rate, streak_days
+
+
+def _load_counts(
+    db: Session, month: date, user_ids: Optional[set[int]] = None
+) -> tuple[dict[int, array], dict[int, int]]:
+    query = (
+        select(User.id, Habit.id, HabitMonthlyBits.day_bits)
+        .outerjoin(Habit, and_(Habit.user_id == User.id, Habit.is_active.is_(True)))
+        .outerjoin(
+            HabitMonthlyBits,
+            and_(HabitMonthlyBits.habit_id == Habit.id, HabitMonthlyBits.month == month)
+        )
+        .where(User.status != DELETED_STATUS)
+    )
+    if user_ids is not None:
+        query = query.where(User.id.in_(user_ids))
+    counts: dict[int, array] = {}
+    habits: dict[int, int] = {}
+    for user_id, habit_id, day_bits in db.execute(query):
+        user_counts = counts.setdefault(user_id, array("H", bytes(62)))
+        habits.setdefault(user_id, 0)
+        if habit_id is None:
+            continue
+        habits[user_id] += 1
+        if day_bits is None:
+            continue
+        for index, done in enumerate(bits_to_list(day_bits)):
+            if done:
+                user_counts[index] += 1
+    return counts, habits
+
+
+class Leaderboard:
+    def __init__(self) -> None:
+        self.month: Optional[date] = None
+        self.day = 0
+        self.loaded_at = 0.0
+        self._counts: dict[int, array] = {}
+        self._habits: dict[int, int] = {}
+        self._scores: dict[int, tuple[int, int]] = {}
+        self._ranking: list[tuple[int, int, int]] = []
+        self._dirty: set[int] = set()
+        self._loading: Optional[set[int]] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ranking)
+
+    def _rank_key(self, user_id: int) -> tuple[int, int, int]:
+        success_rate, streak_days = self._scores[user_id]
+        return -success_rate, -streak_days, user_id
+
+    def _position(self, success_rate: int, streak_days: int) -> int:
+        return bisect_left(self._ranking, (-success_rate, -streak_days, 0))
+
+    def _remove(self, user_id: int) -> None:
+        if user_id in self._scores:
+            del self._ranking[bisect_left(self._ranking, self._rank_key(user_id))]
+            del self._scores[user_id]
+
+    def _rescore(self, user_id: int) -> None:
+        self._remove(user_id)
+        self._scores[user_id] = _score(self._counts[user_id], self._habits[user_id], self.day)
+        insort(self._ranking, self._rank_key(user_id))
+
+    def _is_loading(self, user_id: int) -> bool:
+        return self._loading is not None and (not self._loading or user_id in self._loading)
+
+    def apply_toggle(self, user_id: int, month: date, day_index: int, delta: int) -> None:
+        with self._lock:
+            if self._is_loading(user_id):
+                self._dirty.add(user_id)
+                return
+            if month != self.month or user_id in self._dirty or user_id not in self._counts:
+                return
+            counts = self._counts[user_id]
+            counts[day_index] = min(max(counts[day_index] + delta, 0), self._habits[user_id])
+            self._rescore(user_id)
+
+    def mark_dirty(self, user_id: int) -> None:
+        with self._lock:
+            self._dirty.add(user_id)
+
+    def refresh(self, db: Session, today: Optional[date] = None) -> None:
+        today = today or date.today()
+        month = today.replace(day=1)
+        with self._refresh_lock:
+            expired = time.monotonic() - self.loaded_at > settings.LEADERBOARD_REFRESH_SECONDS
+            if month != self.month or expired:
+                self._rebuild(db, month, today.day)
+            elif today.day != self.day:
+                with self._lock:
+                    self.day = today.day
+                    self._scores = {
+                        user_id: _score(counts, self._habits[user_id], self.day)
+                        for user_id, counts in self._counts.items()
+                    }
+                    self._ranking = sorted(self._rank_key(user_id) for user_id in self._scores)
+            if self._dirty:
+                self._reload_dirty(db)
+
+    def _rebuild(self, db: Session, month: date, day: int) -> None:
+        with self._lock:
+            self._dirty.clear()
+            self._loading = set()
+        try:
+            counts, habits = _load_counts(db, month)
+        except Exception:
+            with self._lock:
+                self._loading = None
+            raise
+        scores = {user_id: _score(counts[user_id], habits[user_id], day) for user_id in counts}
+        ranking = sorted((-rate, -streak, user_id) for user_id, (rate, streak) in scores.items())
+        with self._lock:
+            self.month = month
+            self.day = day
+            self.loaded_at = time.monotonic()
+            self._counts = counts
+            self._habits = habits
+            self._scores = scores
+            self._ranking = ranking
+            self._loading = None
+
+    def _reload_dirty(self, db: Session) -> None:
+        with self._lock:
+            user_ids = set(self._dirty)
+            self._dirty.clear()
+            self._loading = user_ids
+        try:
+            counts, habits = _load_counts(db, self.month, user_ids)
+        except Exception:
+            with self._lock:
+                self._loading = None
+            raise
+        with self._lock:
+            self._loading = None
+            for user_id in user_ids:
+                self._remove(user_id)
+                self._counts.pop(user_id, None)
+                self._habits.pop(user_id, None)
+                if user_id in counts:
+                    self._counts[user_id] = counts[user_id]
+                    self._habits[user_id] = habits[user_id]
+                    self._rescore(user_id)
+
+    def _entry(self, user_id: int) -> dict:
+        success_rate, streak_days = self._scores[user_id]
+        return {
+            "userId": user_id,
+            "rank": self._position(success_rate, streak_days) + 1,
+            "successRate": success_rate,
+            "streakDays": streak_days
+        }
+
+    def top(self, limit: int) -> list[dict]:
+        with self._lock:
+            return [self._entry(user_id) for _, _, user_id in self._ranking[:limit]]
+
+    def rank(self, user_id: int) -> Optional[dict]:
+        with self._lock:
+            return self._entry(user_id) if user_id in self._scores else None
+
+
+leaderboard = Leaderboard()
+
+
+def _handle_invalidation(_topic: str, key: Any) -> None:
+    if isinstance(key, int):
+        leaderboard.mark_dirty(key)
+        return
+    if not isinstance(key, dict) or "userId" not in key:
+        return
+    user_id = int(key["userId"])
+    if "delta" not in key:
+        leaderboard.mark_dirty(user_id)
+        return
+    leaderboard.apply_toggle(
+        user_id, date.fromisoformat(key["month"]), int(key["dayIndex"]), int(key["delta"])
+    )
+
+
+invalidation_bus.subscribe(TOPIC, _handle_invalidation)
+invalidation_bus.subscribe("user", _handle_invalidation)
+
+
+def get_leaderboard(db: Session, limit: int, user_id: Optional[int] = None) -> dict:
+    leaderboard.refresh(db)
+    top = leaderboard.top(limit)
+    user = leaderboard.rank(user_id) if user_id is not None else None
+    entries = top + ([user] if user else [])
+    names = {}
+    if entries:
+        user_ids = {row["userId"] for row in entries}
+        names = dict(db.execute(select(User.id, User.full_name).where(User.id.in_(user_ids))).all())
+    for row in entries:
+        row["name"] = names.get(row["userId"], "")
+    return {
+        "month": leaderboard.month.strftime("%Y-%m"),
+        "totalUsers": len(leaderboard),
+        "top": top,
+        "user": user
+    }
@@ -0,0 +1,110 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.habit import Habit
+from app.models.habit_monthly_bits import HabitMonthlyBits
+from app.models.habit_yearly_bits import HabitYearlyBits
+from app.models.sleep_entry import SleepEntry
+from app.models.user import User
+from app.services.user_service import DELETED_STATUS
+
+
+def _delete_in_batches(
+    db: Session, model, key_columns: tuple, condition, batch_size: int, pause_seconds: float
+) -> int:
+    total = 0
+    while True:
+        keys = select(*key_columns).where(condition).limit(batch_size)
+        if len(key_columns) == 1:
+            statement = delete(model).where(key_columns[0].in_(keys))
+        else:
+            statement = delete(model).where(tuple_(*key_columns).in_(keys))
+        deleted = db.execute(statement, execution_options={"synchronize_session": False}).rowcount
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+
+def _purge_habit_rows(db: Session, habit_ids, batch_size: int, pause_seconds: float) -> dict:
+    return {
+        "habit_months": _delete_in_batches(
+            db,
+            HabitMonthlyBits,
+            (HabitMonthlyBits.habit_id, HabitMonthlyBits.month),
+            HabitMonthlyBits.habit_id.in_(habit_ids),
+            batch_size,
+            pause_seconds
+        ),
+        "habit_years": _delete_in_batches(
+            db,
+            HabitYearlyBits,
+            (HabitYearlyBits.habit_id, HabitYearlyBits.year),
+            HabitYearlyBits.habit_id.in_(habit_ids),
+            batch_size,
+            pause_seconds
+        ),
+    }
+
+
+def _expired_habits(cutoff: datetime):
+    return select(Habit.id).where(Habit.is_active.is_(False), Habit.deleted_at < cutoff)
+
+
+def _expired_users(cutoff: datetime):
+    return select(User.id).where(User.status == DELETED_STATUS, User.deleted_at < cutoff)
+
+
+def pending_purge(db: Session, now: Optional[datetime] = None) -> dict:
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=settings.RETENTION_DAYS)
+    return {
+        "cutoff": cutoff.isoformat(),
+        "habits": db.scalar(select(func.count()).select_from(_expired_habits(cutoff).subquery())),
+        "users": db.scalar(select(func.count()).select_from(_expired_users(cutoff).subquery()))
+    }
+
+
+def purge_deleted(
+    db: Session,
+    batch_size: Optional[int] = None,
+    pause_seconds: Optional[float] = None,
+    now: Optional[datetime] = None
+) -> dict:
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=settings.RETENTION_DAYS)
+    batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+    pause_seconds = settings.RETENTION_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+    stats = {"cutoff": cutoff.isoformat()}
+
+    expired_habits = _expired_habits(cutoff)
+    stats.update(_purge_habit_rows(db, expired_habits, batch_size, pause_seconds))
+    stats["habits"] = _delete_in_batches(
+        db, Habit, (Habit.id,), Habit.id.in_(expired_habits), batch_size, pause_seconds
+    )
+
+    expired_users = _expired_users(cutoff)
+    user_habits = select(Habit.id).where(Habit.user_id.in_(expired_users))
+    user_rows = _purge_habit_rows(db, user_habits, batch_size, pause_seconds)
+    stats["habit_months"] += user_rows["habit_months"]
+    stats["habit_years"] += user_rows["habit_years"]
+    stats["sleep_entries"] = _delete_in_batches(
+        db,
+        SleepEntry,
+        (SleepEntry.id, SleepEntry.sleep_date),
+        SleepEntry.user_id.in_(expired_users),
+        batch_size,
+        pause_seconds
+    )
+    stats["habits"] += _delete_in_batches(
+        db, Habit, (Habit.id,), Habit.user_id.in_(expired_users), batch_size, pause_seconds
+    )
+    stats["users"] = _delete_in_batches(
+        db, User, (User.id,), User.id.in_(expired_users), batch_size, pause_seconds
+    )
+    return stats
@@ -5,6 +5,9 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.events import event_bus
+from app.core.invalidation import invalidation_bus
+from app.core.metrics import timed
 from app.models.sleep_entry import SleepEntry
 from app.models.user import User
 
@@ -18,6 +21,28 @@ BUCKETS = [
     {"label": "9+ hrs", "min": 9.0, "max": None}
 ]
 
+SLEEP_FIELDS = (
+    "entries",
+    "dailyHours",
+    "dayBuckets",
+    "categories",
+    "averageHours",
+    "totalEntries",
+    "bestSleep",
+    "days",
+    "month",
+    "availableMonths"
+)
+SLEEP_ENTRY_FIELDS = {
+    "entries",
+    "dailyHours",
+    "dayBuckets",
+    "categories",
+    "averageHours",
+    "totalEntries",
+    "bestSleep"
+}
+
 
 def _month_start(value: date) -> date:
     return value.replace(day=1)
@@ -81,23 +106,29 @@ def _get_available_months(db: Session, user_id: int) -> list[str]:
     return [_format_month(value) for value in sorted(months, reverse=True)]
 
 
-def list_sleep(db: Session, user_id: int, month: date | None = None) -> dict:
+@timed("list_sleep")
+def list_sleep(
+    db: Session, user_id: int, month: date | None = None, fields: set[str] | None = None
+) -> dict:
+    fields = fields or set(SLEEP_FIELDS)
     month_key = _month_start(month or date.today())
     day_count = _month_days(month_key)
     is_current = month_key == _month_start(date.today())
     start_date = month_key
     end_date = month_key.replace(day=day_count)
     cutoff_date = date.today() if is_current else end_date
-    rows = (
-        db.query(SleepEntry)
-        .filter(
-            SleepEntry.user_id == user_id,
-            SleepEntry.sleep_date >= start_date,
-            SleepEntry.sleep_date <= cutoff_date
+    rows = []
+    if fields & SLEEP_ENTRY_FIELDS:
+        rows = (
+            db.query(SleepEntry)
+            .filter(
+                SleepEntry.user_id == user_id,
+                SleepEntry.sleep_date >= start_date,
+                SleepEntry.sleep_date <= cutoff_date
+            )
+            .order_by(SleepEntry.sleep_date.asc())
+            .all()
         )
-        .order_by(SleepEntry.sleep_date.asc())
-        .all()
-    )
     entry_map = {row.sleep_date: row for row in rows}
     daily_hours = []
     day_buckets = []
@@ -117,31 +148,34 @@ def list_sleep(db: Session, user_id: int, month: date | None = None) -> dict:
     average_hours = round(sum(logged_entries) / total_logged, 2) if total_logged else 0.0
     best_sleep = round(max(logged_entries), 2) if total_logged else 0.0
 
-    bucket_counts = [0] * len(BUCKETS)
-    for hours in logged_entries:
-        bucket_counts[_bucket_for_hours(hours)] += 1
-
     categories = []
-    for index, bucket in enumerate(BUCKETS):
-        count = bucket_counts[index]
-        percent = round((count / total_logged) * 100) if total_logged else 0
-        categories.append(
-            {
-                "index": index,
-                "label": bucket["label"],
-                "minHours": bucket["min"],
-                "maxHours": bucket["max"],
-                "count": count,
-                "percent": percent
-            }
-        )
-
-    entries = [
-        {"id": row.id, "date": row.sleep_date, "hours": float(row.duration_hours)}
-        for row in rows
-    ]
-
-    return {
+    if "categories" in fields:
+        bucket_counts = [0] * len(BUCKETS)
+        for hours in logged_entries:
+            bucket_counts[_bucket_for_hours(hours)] += 1
+
+        for index, bucket in enumerate(BUCKETS):
+            count = bucket_counts[index]
+            percent = round((count / total_logged) * 100) if total_logged else 0
+            categories.append(
+                {
+                    "index": index,
+                    "label": bucket["label"],
+                    "minHours": bucket["min"],
+                    "maxHours": bucket["max"],
+                    "count": count,
+                    "percent": percent
+                }
+            )
+
+    entries = []
+    if "entries" in fields:
+        entries = [
+            {"id": row.id, "date": row.sleep_date, "hours": float(row.duration_hours)}
+            for row in rows
+        ]
+
+    payload = {
         "entries": entries,
         "dailyHours": daily_hours,
         "dayBuckets": day_buckets,
@@ -151,11 +185,31 @@ def list_sleep(db: Session, user_id: int, month: date | None = None) -> dict:
         "bestSleep": best_sleep,
         "days": day_count,
         "month": _format_month(month_key),
-        "availableMonths": _get_available_months(db, user_id)
+        "availableMonths": (
+            _get_available_months(db, user_id) if "availableMonths" in fields else []
+        )
     }
+    return {key: payload[key] for key in SLEEP_FIELDS if key in fields}
+
+
+def _publish_sleep_logged(entry: SleepEntry, db: Session, client_id: str | None) -> None:
+    invalidation_bus.publish("sleep", entry.user_id, db)
+    event_bus.publish(
+        entry.user_id,
+        {
+            "type": "sleep.logged",
+            "entryId": entry.id,
+            "date": entry.sleep_date.isoformat(),
+            "hours": float(entry.duration_hours),
+            "clientId": client_id
+        },
+        db
+    )
 
 
-def upsert_sleep(db: Session, user_id: int, sleep_date: date, hours: float) -> SleepEntry:
+def upsert_sleep(
+    db: Session, user_id: int, sleep_date: date, hours: float, client_id: str | None = None
+) -> SleepEntry:
     entry = (
         db.query(SleepEntry)
         .filter(SleepEntry.user_id == user_id, SleepEntry.sleep_date == sleep_date)
@@ -163,30 +217,53 @@ def upsert_sleep(db: Session, user_id: int, sleep_date: date, hours: float) -> S
     )
     if entry:
         entry.duration_hours = hours
+        _publish_sleep_logged(entry, db, client_id)
         db.commit()
         db.refresh(entry)
         return entry
 
     entry = SleepEntry(user_id=user_id, sleep_date=sleep_date, duration_hours=hours)
     db.add(entry)
+    db.flush()
+    _publish_sleep_logged(entry, db, client_id)
     db.commit()
     db.refresh(entry)
     return entry
 
 
-def delete_sleep(db: Session, user_id: int, entry_id: int) -> bool:
-    entry = (
-        db.query(SleepEntry)
-        .filter(SleepEntry.id == entry_id, SleepEntry.user_id == user_id)
-        .first()
-    )
+def delete_sleep(
+    db: Session,
+    user_id: int,
+    entry_id: int,
+    sleep_date: date | None = None,
+    client_id: str | None = None
+) -> bool:
+    filters = [SleepEntry.id == entry_id, SleepEntry.user_id == user_id]
+    if sleep_date is not None:
+        filters.append(SleepEntry.sleep_date == sleep_date)
+    entry = db.query(SleepEntry).filter(*filters).first()
     if not entry:
         return False
-    db.delete(entry)
+    sleep_date = entry.sleep_date
+    db.query(SleepEntry).filter(
+        SleepEntry.id == entry_id, SleepEntry.sleep_date == sleep_date
+    ).delete(synchronize_session=False)
+    invalidation_bus.publish("sleep", user_id, db)
+    event_bus.publish(
+        user_id,
+        {
+            "type": "sleep.deleted",
+            "entryId": entry_id,
+            "date": sleep_date.isoformat(),
+            "clientId": client_id
+        },
+        db
+    )
     db.commit()
     return True
 
 
+@timed("get_admin_sleep_report")
 def get_admin_sleep_report(db: Session, user_ids: list[int]) -> dict:
     if not user_ids:
         return {"averageHours": 0.0, "totalEntries": 0, "totalHours": 0.0, "topSleepers": []}
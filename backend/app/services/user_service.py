@@ -1,14 +1,22 @@
+from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import update
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 
+from app.core.invalidation import invalidation_bus
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
 from app.utils.validators import normalize_email, validate_password
 
 
+DELETED_STATUS = "deleted"
+DELETED_EMAIL_DOMAIN = "deleted.invalid"
+
+
 def list_users(db: Session) -> list[User]:
-    return db.query(User).order_by(User.id.desc()).all()
+    return db.query(User).filter(User.status != DELETED_STATUS).order_by(User.id.desc()).all()
 
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
@@ -38,6 +46,8 @@ def create_user(
         token_version=0
     )
     db.add(user)
+    db.flush()
+    invalidation_bus.publish("user", user.id, db)
     db.commit()
     db.refresh(user)
     return user
@@ -55,6 +65,7 @@ def update_user(
         user.email = normalize_email(email)
     if status:
         user.status = status
+    invalidation_bus.publish("user", user.id, db)
     db.commit()
     db.refresh(user)
     return user
@@ -67,6 +78,7 @@ def update_password(db: Session, user_id: int, password: str) -> bool:
     validate_password(password)
     user.password_hash = get_password_hash(password)
     user.token_version = (user.token_version or 0) + 1
+    invalidation_bus.publish("user", user_id, db)
     db.commit()
     return True
 
@@ -90,23 +102,52 @@ def update_profile(
         user.bio = bio
     if avatar_url is not None:
         user.avatar_url = avatar_url
+    invalidation_bus.publish("user", user.id, db)
     db.commit()
     db.refresh(user)
     return user
 
 
+def upgrade_password_hash(
+    bind: Engine | Connection, user_id: int, password: str, current_hash: str
+) -> bool:
+    new_hash = get_password_hash(password)
+    with Session(bind=bind) as db:
+        updated = db.execute(
+            update(User)
+            .where(User.id == user_id, User.password_hash == current_hash)
+            .values(password_hash=new_hash)
+        ).rowcount
+        db.commit()
+    return bool(updated)
+
+
 def increment_token_version(db: Session, user_id: int) -> bool:
     user = get_user(db, user_id)
     if not user:
         return False
     user.token_version = (user.token_version or 0) + 1
+    invalidation_bus.publish("user", user_id, db)
+    db.commit()
+    return True
+
+
+def mark_deleted(db: Session, user_id: int) -> bool:
+    user = get_user(db, user_id)
+    if not user or user.status == DELETED_STATUS:
+        return False
+    user.status = DELETED_STATUS
+    user.email = f"user-{user.id}@{DELETED_EMAIL_DOMAIN}"
+    user.deleted_at = datetime.now(timezone.utc)
+    user.token_version = (user.token_version or 0) + 1
+    invalidation_bus.publish("user", user_id, db)
     db.commit()
     return True
 
 
 def authenticate(db: Session, email: str, password: str) -> Optional[User]:
     user = get_user_by_email(db, email)
-    if not user:
+    if not user or user.status == DELETED_STATUS:
         return None
     if not verify_password(password, user.password_hash):
         return None
@@ -1,10 +1,12 @@
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.request_context import span
+from app.core.security import decode_access_token
 from app.services import user_service
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -14,6 +16,12 @@ def get_request(request: Request) -> Request:
     return request
 
 
+def get_client_id(
+    client_id: str | None = Header(default=None, alias="X-Client-Id", max_length=64)
+) -> str | None:
+    return client_id
+
+
 def get_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
@@ -32,19 +40,20 @@ def get_current_user(
     if not token:
         raise credentials_exception
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        subject = payload.get("sub")
-        if subject is None:
-            raise credentials_exception
-        user_id = int(subject)
-        token_version = int(payload.get("ver", 0))
+        with span("auth_decode"):
+            user_id, token_version, _ = decode_access_token(token)
     except (JWTError, ValueError):
         raise credentials_exception
-    user = user_service.get_user(db, user_id)
+    with span("auth_user"):
+        user = user_service.get_user(db, user_id)
     if not user:
         raise credentials_exception
     if (user.token_version or 0) != token_version:
         raise credentials_exception
+    db.expunge(user)
+    db.commit()
+    db.info["actor_id"] = user.id
+    request.state.user_id = user.id
     return user
 
 
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Iterable
+from typing import Iterable, Optional
 
 
 def format_date(value: date) -> str:
@@ -12,3 +12,13 @@ def clamp(value: int, min_value: int, max_value: int) -> int:
 
 def sum_iter(items: Iterable[int]) -> int:
     return sum(items)
+
+
+def parse_fields(value: Optional[str], allowed: Iterable[str]) -> Optional[set[str]]:
+    if not value:
+        return None
+    fields = {item.strip() for item in value.split(",") if item.strip()}
+    unknown = fields - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields or None
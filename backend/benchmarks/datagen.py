@@ -0,0 +1,124 @@
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import Base, Habit, HabitMonthlyBits, SleepEntry, User
+
+SCALES = {
+    "small": (10, 5, 3),
+    "medium": (100, 10, 6),
+    "large": (1000, 20, 12),
+}
+
+
+@dataclass
+class Dataset:
+    seed: int
+    user_ids: list[int] = field(default_factory=list)
+    habit_ids: dict[int, list[int]] = field(default_factory=dict)
+    months: list[date] = field(default_factory=list)
+
+
+def user_email(seed: int, index: int) -> str:
+    return f"bench{seed}-{index}@example.com"
+
+
+def parse_scale(value: str) -> tuple[int, int, int]:
+    if value in SCALES:
+        return SCALES[value]
+    parts = [int(part) for part in value.split("x")]
+    if len(parts) != 3 or min(parts) < 1:
+        raise ValueError(f"Invalid scale: {value}")
+    return parts[0], parts[1], parts[2]
+
+
+def month_keys(count: int, today: date | None = None) -> list[date]:
+    current = (today or date.today()).replace(day=1)
+    months = [current]
+    while len(months) < count:
+        months.append((months[-1] - timedelta(days=1)).replace(day=1))
+    return sorted(months)
+
+
+def _random_bits(rng: random.Random, density: float) -> str:
+    return "".join("1" if rng.random() < density else "0" for _ in range(31))
+
+
+def _month_dates(month: date, today: date) -> list[date]:
+    day = month
+    dates = []
+    while day.month == month.month and day <= today:
+        dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+
+def reset_schema(engine) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def generate(
+    db: Session,
+    users: int,
+    habits_per_user: int,
+    months: int,
+    seed: int = 42,
+    completion: float = 0.6,
+    sleep_density: float = 0.9,
+    batch_size: int = 5000,
+    password_hash: str = "x"
+) -> Dataset:
+    rng = random.Random(seed)
+    today = date.today()
+    dataset = Dataset(seed=seed, months=month_keys(months, today))
+
+    user_rows = [
+        User(
+            email=user_email(seed, index),
+            password_hash=password_hash,
+            full_name=f"Bench User {index}",
+            role="user",
+            status="active",
+            token_version=0
+        )
+        for index in range(users)
+    ]
+    db.add_all(user_rows)
+    db.flush()
+    dataset.user_ids = [user.id for user in user_rows]
+
+    habit_rows = [
+        Habit(user_id=user_id, name=f"Habit {index + 1}", is_active=True)
+        for user_id in dataset.user_ids
+        for index in range(habits_per_user)
+    ]
+    db.add_all(habit_rows)
+    db.flush()
+    for habit in habit_rows:
+        dataset.habit_ids.setdefault(habit.user_id, []).append(habit.id)
+
+    bits_rows = [
+        {"habit_id": habit.id, "month": month, "day_bits": _random_bits(rng, completion)}
+        for habit in habit_rows
+        for month in dataset.months
+    ]
+    sleep_rows = [
+        {
+            "user_id": user_id,
+            "sleep_date": day,
+            "duration_hours": round(rng.uniform(4.5, 9.5) * 4) / 4
+        }
+        for user_id in dataset.user_ids
+        for month in dataset.months
+        for day in _month_dates(month, today)
+        if rng.random() < sleep_density
+    ]
+    for model, rows in ((HabitMonthlyBits, bits_rows), (SleepEntry, sleep_rows)):
+        for start in range(0, len(rows), batch_size):
+            db.execute(insert(model), rows[start:start + batch_size])
+    db.commit()
+    return dataset
@@ -0,0 +1,383 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.security import get_password_hash
+from app.services import user_service
+from benchmarks.datagen import generate, parse_scale, reset_schema, user_email
+from benchmarks.services import percentile
+
+BENCH_PASSWORD = "Bench!Passw0rd"
+RATE_LIMITED = 429
+
+MIXES = {
+    "default": {
+        "dashboard": 35,
+        "habits": 20,
+        "toggle_burst": 15,
+        "sleep": 10,
+        "sleep_upsert": 10,
+        "bootstrap": 5,
+        "login": 5,
+    },
+    "read-heavy": {"dashboard": 50, "habits": 25, "sleep": 15, "bootstrap": 8, "login": 2},
+    "write-heavy": {"toggle_burst": 45, "sleep_upsert": 30, "habits": 15, "dashboard": 10},
+    "login-storm": {"login": 80, "dashboard": 20},
+}
+ADMIN_MIX = {"admin_report": 70, "admin_stats": 30}
+
+
+def admin_email(seed: int) -> str:
+    return f"bench{seed}-admin@example.com"
+
+
+class LoginRateLimited(Exception):
+    pass
+
+
+class HttpConnection:
+    def __init__(self, base_url: str) -> None:
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = None
+        self.writer = None
+
+    async def request(
+        self, method: str, path: str, body: dict | None = None, headers: dict | None = None
+    ) -> tuple[int, bytes]:
+        reused = self.writer is not None
+        if not reused:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            return await self._roundtrip(method, path, body, headers or {})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            if not reused:
+                raise
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            return await self._roundtrip(method, path, body, headers or {})
+
+    async def _roundtrip(
+        self, method: str, path: str, body: dict | None, headers: dict
+    ) -> tuple[int, bytes]:
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        lines = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            f"Content-Length: {len(payload)}",
+        ]
+        if body is not None:
+            lines.append("Content-Type: application/json")
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked()
+        else:
+            data = await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, data
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readuntil(b"\r\n")
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+        self.rate_limited: Counter = Counter()
+
+    def record(self, name: str, seconds: float, status: int) -> None:
+        self.latencies[name].append(seconds * 1000)
+        self.statuses[name][str(status)] += 1
+        if status == 0 or status >= 400:
+            self.errors[name] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for name, samples in sorted(self.latencies.items()):
+            endpoints[name] = {
+                "requests": len(samples),
+                "rps": round(len(samples) / elapsed, 2),
+                "errors": self.errors[name],
+                "error_rate": round(self.errors[name] / len(samples), 4),
+                "p50_ms": round(percentile(samples, 50), 2),
+                "p95_ms": round(percentile(samples, 95), 2),
+                "p99_ms": round(percentile(samples, 99), 2),
+                "max_ms": round(max(samples), 2),
+                "statuses": dict(self.statuses[name])
+            }
+        total = sum(len(samples) for samples in self.latencies.values())
+        errors = sum(self.errors.values())
+        everything = [value for samples in self.latencies.values() for value in samples]
+        return {
+            "requests": total,
+            "rps": round(total / elapsed, 2) if elapsed else 0.0,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "p50_ms": round(percentile(everything, 50), 2) if everything else 0.0,
+            "p95_ms": round(percentile(everything, 95), 2) if everything else 0.0,
+            "p99_ms": round(percentile(everything, 99), 2) if everything else 0.0,
+            "rate_limited": dict(self.rate_limited),
+            "endpoints": endpoints
+        }
+
+
+class VirtualUser:
+    def __init__(
+        self,
+        base_url: str,
+        recorder: Recorder,
+        rng: random.Random,
+        email: str,
+        mix: dict[str, int],
+        think: float
+    ) -> None:
+        self.connection = HttpConnection(base_url)
+        self.recorder = recorder
+        self.rng = rng
+        self.email = email
+        self.actions = list(mix)
+        self.weights = list(mix.values())
+        self.think = think
+        self.headers: dict[str, str] = {}
+        self.habit_ids: list[int] = []
+
+    async def call(self, name: str, method: str, path: str, body: dict | None = None):
+        started = time.perf_counter()
+        try:
+            status, data = await self.connection.request(method, path, body, self.headers)
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            await self.connection.close()
+            self.recorder.record(name, time.perf_counter() - started, 0)
+            return 0, None
+        if status == RATE_LIMITED:
+            self.recorder.rate_limited[name] += 1
+            return status, data
+        self.recorder.record(name, time.perf_counter() - started, status)
+        return status, data
+
+    async def run(self, deadline: float) -> None:
+        try:
+            await self.do_login()
+            await self.do_habits()
+            while time.monotonic() < deadline:
+                action = self.rng.choices(self.actions, self.weights)[0]
+                await getattr(self, f"do_{action}")()
+                if self.think > 0:
+                    await asyncio.sleep(self.rng.expovariate(1 / self.think))
+        finally:
+            await self.connection.close()
+
+    async def do_login(self) -> None:
+        status, data = await self.call(
+            "login",
+            "POST",
+            "/auth/login",
+            {"email": self.email, "password": BENCH_PASSWORD}
+        )
+        if status == RATE_LIMITED:
+            raise LoginRateLimited(self.email)
+        if status == 200:
+            self.headers = {"Authorization": f"Bearer {json.loads(data)['access_token']}"}
+
+    async def do_habits(self) -> None:
+        status, data = await self.call("habits", "GET", "/habits")
+        if status == 200:
+            self.habit_ids = [row["id"] for row in json.loads(data).get("habitMatrix", [])]
+
+    async def do_dashboard(self) -> None:
+        await self.call("dashboard", "GET", "/dashboard")
+
+    async def do_bootstrap(self) -> None:
+        await self.call("bootstrap", "GET", "/bootstrap")
+
+    async def do_toggle_burst(self) -> None:
+        if not self.habit_ids:
+            return
+        today = date.today()
+        for _ in range(self.rng.randint(3, 8)):
+            habit_id = self.rng.choice(self.habit_ids)
+            await self.call(
+                "toggle",
+                "POST",
+                f"/habits/{habit_id}/toggle",
+                {"dayIndex": self.rng.randrange(today.day)}
+            )
+
+    async def do_sleep(self) -> None:
+        await self.call("sleep", "GET", "/sleep")
+
+    async def do_sleep_upsert(self) -> None:
+        today = date.today()
+        day = today - timedelta(days=self.rng.randrange(today.day))
+        await self.call(
+            "sleep_upsert",
+            "POST",
+            "/sleep",
+            {"date": day.isoformat(), "hours": round(self.rng.uniform(4.5, 9.5) * 4) / 4}
+        )
+
+    async def do_admin_report(self) -> None:
+        await self.call("admin_report", "GET", "/admin/report")
+
+    async def do_admin_stats(self) -> None:
+        await self.call("admin_stats", "GET", "/admin/stats")
+
+
+async def run_load(args) -> dict:
+    total_users = parse_scale(args.scale)[0]
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    started = time.monotonic()
+    deadline = started + args.ramp_up + args.duration
+    virtual_users = [
+        VirtualUser(
+            args.base_url,
+            recorder,
+            random.Random(rng.random()),
+            user_email(args.seed, index % total_users),
+            MIXES[args.mix],
+            args.think
+        )
+        for index in range(args.users)
+    ]
+    virtual_users.extend(
+        VirtualUser(
+            args.base_url,
+            recorder,
+            random.Random(rng.random()),
+            admin_email(args.seed),
+            ADMIN_MIX,
+            max(args.think, 1.0)
+        )
+        for _ in range(args.admins)
+    )
+
+    async def start(index: int, user: VirtualUser) -> None:
+        if args.ramp_up and len(virtual_users) > 1:
+            await asyncio.sleep(args.ramp_up * index / (len(virtual_users) - 1))
+        await user.run(deadline)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            for index, user in enumerate(virtual_users):
+                group.create_task(start(index, user))
+    except* LoginRateLimited:
+        raise SystemExit(
+            "Login returned 429: the API's login rate limiter is on, so results would measure "
+            "the limiter instead of the login path. Restart the API with "
+            "LOGIN_RATE_LIMIT_ENABLED=false and run again."
+        ) from None
+    elapsed = time.monotonic() - started
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "mix": args.mix,
+            "users": args.users,
+            "admins": args.admins,
+            "duration_s": round(elapsed, 2),
+            "think_s": args.think,
+            "seed": args.seed
+        },
+        "summary": recorder.summary(elapsed)
+    }
+
+
+def seed(args) -> None:
+    users, habits_per_user, months = parse_scale(args.scale)
+    engine = create_engine(args.database_url)
+    reset_schema(engine)
+    with sessionmaker(bind=engine, autocommit=False, autoflush=False)() as db:
+        generate(
+            db,
+            users,
+            habits_per_user,
+            months,
+            seed=args.seed,
+            password_hash=get_password_hash(BENCH_PASSWORD)
+        )
+        user_service.create_user(
+            db, "Bench Admin", admin_email(args.seed), BENCH_PASSWORD, role="admin"
+        )
+    print(json.dumps({"users": users, "habits_per_user": habits_per_user, "months": months}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed and replay realistic API traffic.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser(
+        "seed", help="Drop, recreate and seed every table in the target database."
+    )
+    seed_parser.add_argument("--database-url", required=True)
+    seed_parser.add_argument("--scale", default="medium")
+    seed_parser.add_argument("--seed", type=int, default=42)
+
+    run_parser = commands.add_parser("run", help="Replay a traffic mix against a running API.")
+    run_parser.add_argument("--base-url", default="http://127.0.0.1:8000/api")
+    run_parser.add_argument("--scale", default="medium")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    run_parser.add_argument("--users", type=int, default=20)
+    run_parser.add_argument("--admins", type=int, default=1)
+    run_parser.add_argument("--duration", type=float, default=30.0)
+    run_parser.add_argument("--ramp-up", type=float, default=5.0)
+    run_parser.add_argument("--think", type=float, default=0.5)
+    run_parser.add_argument("--output")
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        seed(args)
+        return
+    report = asyncio.run(run_load(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import json
+import statistics
+import time
+
+from passlib.hash import pbkdf2_sha256
+
+from app.core.config import settings
+
+PROBE_PASSWORD = "Bench!Passw0rd"
+
+
+def verify_ms(rounds: int, samples: int) -> float:
+    hashed = pbkdf2_sha256.using(rounds=rounds).hash(PROBE_PASSWORD)
+    pbkdf2_sha256.verify(PROBE_PASSWORD, hashed)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        pbkdf2_sha256.verify(PROBE_PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def pick_rounds(target_ms: float, samples: int, probe_rounds: int, step: int) -> dict:
+    per_round = verify_ms(probe_rounds, samples) / probe_rounds
+    rounds = max(step, round(target_ms / per_round / step) * step)
+    for _ in range(3):
+        measured = verify_ms(rounds, samples)
+        adjusted = max(step, round(rounds * target_ms / measured / step) * step)
+        if adjusted == rounds:
+            break
+        rounds = adjusted
+    return {
+        "target_ms": target_ms,
+        "rounds": rounds,
+        "verify_ms": round(verify_ms(rounds, samples), 2),
+        "current_rounds": settings.PASSWORD_HASH_ROUNDS,
+        "current_verify_ms": round(verify_ms(settings.PASSWORD_HASH_ROUNDS, samples), 2)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Pick PASSWORD_HASH_ROUNDS for a target pbkdf2_sha256 verify latency."
+    )
+    parser.add_argument("--target-ms", type=float, default=50.0)
+    parser.add_argument("--samples", type=int, default=15)
+    parser.add_argument("--probe-rounds", type=int, default=20000)
+    parser.add_argument("--step", type=int, default=1000)
+    args = parser.parse_args()
+
+    result = pick_rounds(args.target_ms, args.samples, args.probe_rounds, args.step)
+    print(json.dumps(result))
+    print(f"PASSWORD_HASH_ROUNDS={result['rounds']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+from datetime import date
+
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+
+HOT_QUERIES = {
+    "list_active_habits": (
+        "SELECT id, name FROM habits "
+        "WHERE user_id = :user_id AND is_active IS true ORDER BY id"
+    ),
+    "habit_count": (
+        "SELECT count(*) FROM habits WHERE user_id = :user_id AND is_active IS true"
+    ),
+    "toggle_lookup": (
+        "SELECT id FROM habits "
+        "WHERE id = :habit_id AND user_id = :user_id AND is_active IS true"
+    ),
+    "available_months": (
+        "SELECT DISTINCT habit_monthly_bits.month FROM habit_monthly_bits "
+        "JOIN habits ON habits.id = habit_monthly_bits.habit_id "
+        "WHERE habits.user_id = :user_id"
+    ),
+    "past_month_habits": (
+        "SELECT habits.id FROM habits "
+        "JOIN habit_monthly_bits ON habit_monthly_bits.habit_id = habits.id "
+        "WHERE habits.user_id = :user_id AND habit_monthly_bits.month = :month "
+        "ORDER BY habits.id"
+    ),
+}
+
+SEED_SQL = [
+    (
+        "INSERT INTO users (email, password_hash, full_name, role, status, token_version) "
+        "SELECT 'bench' || g || '@example.com', 'x', 'Bench ' || g, 'user', 'active', 0 "
+        "FROM generate_series(1, :users) AS g"
+    ),
+    (
+        "INSERT INTO habits (user_id, name, is_active) "
+        "SELECT u.id, 'Habit ' || g, (g % 10) <> 0 "
+        "FROM (SELECT id FROM users WHERE email LIKE 'bench%@example.com') AS u, "
+        "generate_series(1, :per_user) AS g"
+    ),
+    (
+        "INSERT INTO habit_monthly_bits (habit_id, month, day_bits) "
+        "SELECT id, :month, B'0000000000000000000000000000000' FROM habits "
+        "ON CONFLICT DO NOTHING"
+    ),
+    "ANALYZE users",
+    "ANALYZE habits",
+    "ANALYZE habit_monthly_bits",
+]
+
+
+def seed(connection, habits: int, users: int, month: date) -> None:
+    per_user = max(1, habits // users)
+    params = {"users": users, "per_user": per_user, "month": month}
+    for statement in SEED_SQL:
+        connection.execute(text(statement), params)
+
+
+def explain(connection, params: dict) -> dict[str, list[str]]:
+    plans = {}
+    for name, query in HOT_QUERIES.items():
+        rows = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params).all()
+        plans[name] = [row[0] for row in rows]
+    return plans
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print query plans for the hot habit queries.")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--seed-habits", type=int, default=0)
+    parser.add_argument("--seed-users", type=int, default=10000)
+    args = parser.parse_args()
+
+    month = date.today().replace(day=1)
+    engine = create_engine(args.database_url)
+    with engine.begin() as connection:
+        if args.seed_habits:
+            seed(connection, args.seed_habits, args.seed_users, month)
+        row = connection.execute(
+            text("SELECT user_id, id FROM habits WHERE is_active IS true ORDER BY random() LIMIT 1")
+        ).first()
+        if row is None:
+            raise SystemExit("No habits found; run with --seed-habits")
+        params = {"user_id": row.user_id, "habit_id": row.id, "month": month}
+        for name, lines in explain(connection, params).items():
+            print(f"== {name}")
+            for line in lines:
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.middleware import SecurityHeadersMiddleware
+
+
+async def endpoint(scope, receive, send) -> None:
+    response = JSONResponse({"status": "ok"})
+    await response(scope, receive, send)
+
+
+async def add_security_headers(request, call_next):
+    response = await call_next(request)
+    response.headers.setdefault("Content-Security-Policy", settings.CSP_POLICY)
+    response.headers.setdefault("X-Content-Type-Options", "nosniff")
+    response.headers.setdefault("X-Frame-Options", "DENY")
+    response.headers.setdefault("Referrer-Policy", "no-referrer")
+    response.headers.setdefault("Permissions-Policy", "geolocation=()")
+    return response
+
+
+def _scope() -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/health",
+        "raw_path": b"/api/health",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+
+
+async def _run(app, iterations: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message):
+        return None
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await app(_scope(), receive, send)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def main(iterations: int) -> None:
+    variants = {
+        "no_middleware": endpoint,
+        "base_http_middleware": BaseHTTPMiddleware(endpoint, dispatch=add_security_headers),
+        "asgi_middleware": SecurityHeadersMiddleware(endpoint),
+    }
+    for name, app in variants.items():
+        await _run(app, min(iterations, 1000))
+        per_request = await _run(app, iterations)
+        print(f"{name}: {per_request:.2f} us/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare security header middleware overhead.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,68 @@
+import argparse
+import json
+import random
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import FastJSONResponse
+from app.schemas.habit import HabitsResponse
+
+
+def build_payload(habit_count: int, day_count: int = 31, seed: int = 42) -> dict:
+    rng = random.Random(seed)
+    matrix = [
+        {
+            "id": index + 1,
+            "habit": f"Habit {index + 1}",
+            "days": [rng.random() < 0.6 for _ in range(day_count)]
+        }
+        for index in range(habit_count)
+    ]
+    return {
+        "habits": [row["habit"] for row in matrix],
+        "habitMatrix": matrix,
+        "days": day_count,
+        "month": "2025-01",
+        "availableMonths": ["2025-01", "2024-12"]
+    }
+
+
+def validated_stdlib(payload: dict) -> bytes:
+    model = HabitsResponse(**payload)
+    return json.dumps(jsonable_encoder(model)).encode("utf-8")
+
+
+def fast_path(payload: dict) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+def _time(func, payload: dict, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(payload)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time habit response serialization.")
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    results = []
+    for size in [int(value) for value in args.sizes.split(",") if value]:
+        payload = build_payload(size)
+        results.append(
+            {
+                "habits": size,
+                "validated_stdlib_ms": round(_time(validated_stdlib, payload, args.repeat), 3),
+                "fast_path_ms": round(_time(fast_path, payload, args.repeat), 3),
+                "bytes": len(fast_path(payload))
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
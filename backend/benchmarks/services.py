@@ -0,0 +1,158 @@
+import argparse
+import json
+import platform
+import random
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+import sqlalchemy
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.query_budget import count_queries
+from app.services import archive_service, habit_service, sleep_service
+from benchmarks.datagen import Dataset, generate, parse_scale, reset_schema
+
+BENCHMARKS = (
+    "list_habits",
+    "list_habits_past",
+    "get_dashboard",
+    "toggle_habit",
+    "get_admin_report",
+    "list_sleep",
+    "get_admin_sleep_report",
+)
+
+
+def build_cases(dataset: Dataset, rng: random.Random) -> dict[str, Callable[[Session], object]]:
+    current = dataset.months[-1]
+    past = dataset.months[0]
+
+    def pick_user() -> int:
+        return rng.choice(dataset.user_ids)
+
+    def toggle(db: Session) -> object:
+        user_id = pick_user()
+        habit_id = rng.choice(dataset.habit_ids[user_id])
+        return habit_service.toggle_habit(db, user_id, habit_id, 0, None, current)
+
+    return {
+        "list_habits": lambda db: habit_service.list_habits(db, pick_user(), current),
+        "list_habits_past": lambda db: habit_service.list_habits(db, pick_user(), past),
+        "get_dashboard": lambda db: habit_service.get_dashboard(db, pick_user(), current),
+        "toggle_habit": toggle,
+        "get_admin_report": lambda db: habit_service.get_admin_report(db, dataset.user_ids),
+        "list_sleep": lambda db: sleep_service.list_sleep(db, pick_user(), current),
+        "get_admin_sleep_report": lambda db: sleep_service.get_admin_sleep_report(
+            db, dataset.user_ids
+        ),
+    }
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_case(
+    session_factory: sessionmaker, case: Callable[[Session], object], repeat: int, warmup: int
+) -> dict:
+    for _ in range(warmup):
+        with session_factory() as db:
+            case(db)
+    samples = []
+    queries = 0
+    for _ in range(repeat):
+        with session_factory() as db, count_queries() as counter:
+            started = time.perf_counter()
+            case(db)
+            samples.append((time.perf_counter() - started) * 1000)
+        queries += counter.count
+    return {
+        "repeat": repeat,
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "min_ms": round(min(samples), 3),
+        "queries": round(queries / repeat, 2)
+    }
+
+
+def compare(results: list[dict], baseline: dict) -> None:
+    previous = {(row["scale"], row["benchmark"]): row for row in baseline.get("results", [])}
+    for row in results:
+        base = previous.get((row["scale"], row["benchmark"]))
+        if not base or not base.get("p50_ms"):
+            continue
+        row["baseline_p50_ms"] = base["p50_ms"]
+        row["p50_change_pct"] = round((row["p50_ms"] / base["p50_ms"] - 1) * 100, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the habit and sleep services against seeded synthetic data. "
+        "Drops and recreates every table in the target database."
+    )
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--scales", default="small,medium")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--archive", action="store_true")
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    args = parser.parse_args()
+
+    selected = [name for name in args.benchmarks.split(",") if name]
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        raise SystemExit(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    engine = create_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    results = []
+    for scale in [value for value in args.scales.split(",") if value]:
+        users, habits_per_user, months = parse_scale(scale)
+        reset_schema(engine)
+        with session_factory() as db:
+            dataset = generate(db, users, habits_per_user, months, seed=args.seed)
+            if args.archive:
+                archive_service.compact_closed_months(db)
+        cases = build_cases(dataset, random.Random(args.seed))
+        for name in selected:
+            row = {
+                "scale": scale,
+                "users": users,
+                "habits_per_user": habits_per_user,
+                "months": months,
+                "benchmark": name
+            }
+            row.update(run_case(session_factory, cases[name], args.repeat, args.warmup))
+            results.append(row)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "seed": args.seed,
+            "archive": args.archive
+        },
+        "results": results
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            compare(results, json.load(handle))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
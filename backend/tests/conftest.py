@@ -1,10 +1,77 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.query_budget import count_queries
+from app.core.rate_limit import login_limiter
+from app.core.security import create_access_token
 from app.main import create_app
+from app.models import Base
+from app.services import user_service
 
 
 @pytest.fixture()
-def client() -> TestClient:
+def db_engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def session_factory(db_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+
+@pytest.fixture()
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def client(monkeypatch, session_factory) -> TestClient:
+    monkeypatch.setattr(settings, "QUERY_BUDGET_MODE", "raise")
+    login_limiter.reset()
     app = create_app()
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
     return TestClient(app)
+
+
+@pytest.fixture()
+def user(db):
+    return user_service.create_user(db, "Test User", "user@example.com", "Passw0rd!")
+
+
+@pytest.fixture()
+def auth_headers(user) -> dict:
+    token = create_access_token(subject=str(user.id), token_version=user.token_version or 0)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def admin_headers(db) -> dict:
+    admin = user_service.create_user(db, "Admin", "admin@example.com", "Passw0rd!", role="admin")
+    token = create_access_token(subject=str(admin.id), token_version=admin.token_version or 0)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def query_counter():
+    with count_queries() as counter:
+        yield counter
@@ -0,0 +1,20 @@
+from app.services import leaderboard_service
+from app.services.leaderboard_service import Leaderboard
+
+
+def test_admin_endpoints_within_query_budgets(client, user, admin_headers, monkeypatch):
+    monkeypatch.setattr(leaderboard_service, "leaderboard", Leaderboard())
+    stats = client.get("/api/admin/stats", headers=admin_headers)
+    assert stats.status_code == 200
+    assert stats.json()["activeUsers"] == 2
+    assert client.get("/api/admin/report", headers=admin_headers).status_code == 200
+    leaderboard = client.get(
+        "/api/admin/leaderboard", params={"userId": user.id}, headers=admin_headers
+    )
+    assert leaderboard.status_code == 200
+    assert leaderboard.json()["user"]["userId"] == user.id
+    assert client.get("/api/admin/db-pool", headers=admin_headers).status_code == 200
+
+
+def test_admin_endpoints_reject_regular_users(client, auth_headers):
+    assert client.get("/api/admin/stats", headers=auth_headers).status_code == 403
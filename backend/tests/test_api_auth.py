@@ -0,0 +1,14 @@
+def test_auth_flow_within_query_budgets(client):
+    signup = client.post(
+        "/api/auth/signup",
+        json={"email": "new@example.com", "password": "Passw0rd!", "full_name": "New User"}
+    )
+    assert signup.status_code == 200
+
+    login = client.post(
+        "/api/auth/login", json={"email": "new@example.com", "password": "Passw0rd!"}
+    )
+    assert login.status_code == 200
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+    assert client.get("/api/users/me", headers=headers).status_code == 401
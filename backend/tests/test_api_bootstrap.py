@@ -0,0 +1,33 @@
+from datetime import date
+
+from app.core.query_budget import count_queries
+
+
+def test_bootstrap_returns_every_section(client, auth_headers):
+    client.post("/api/habits", json={"name": "Read"}, headers=auth_headers)
+    client.post(
+        "/api/sleep", json={"date": date.today().isoformat(), "hours": 7}, headers=auth_headers
+    )
+
+    with count_queries() as counter:
+        response = client.get("/api/bootstrap", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"user", "dashboard", "habits", "sleep"}
+    assert data["user"]["email"] == "user@example.com"
+    assert data["habits"]["habits"] == ["Read"]
+    assert data["dashboard"]["month"] == data["sleep"]["month"]
+    assert counter.count <= 11
+
+
+def test_bootstrap_sections_skip_unrequested_queries(client, auth_headers):
+    with count_queries() as counter:
+        response = client.get("/api/bootstrap", params={"sections": "user"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"user"}
+    assert counter.count == 1
+    assert client.get(
+        "/api/bootstrap", params={"sections": "user,bogus"}, headers=auth_headers
+    ).status_code == 400
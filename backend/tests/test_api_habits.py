@@ -0,0 +1,33 @@
+def test_habit_flow_within_query_budgets(client, auth_headers):
+    created = client.post("/api/habits", json={"name": "Read"}, headers=auth_headers)
+    assert created.status_code == 200
+    habit_id = created.json()["habit"]["id"]
+
+    toggled = client.post(
+        f"/api/habits/{habit_id}/toggle",
+        json={"dayIndex": 0, "done": True},
+        headers=auth_headers
+    )
+    assert toggled.status_code == 200
+    assert toggled.json()["habitMatrix"][0]["days"][0] is True
+
+    listed = client.get("/api/habits", headers=auth_headers)
+    assert listed.json()["habits"] == ["Read"]
+    assert client.get("/api/dashboard", headers=auth_headers).status_code == 200
+    assert client.get("/api/bootstrap", headers=auth_headers).status_code == 200
+    assert client.delete(f"/api/habits/{habit_id}", headers=auth_headers).status_code == 200
+
+
+def test_sleep_flow_within_query_budgets(client, auth_headers):
+    from datetime import date
+
+    logged = client.post(
+        "/api/sleep", json={"date": date.today().isoformat(), "hours": 7.5}, headers=auth_headers
+    )
+    assert logged.status_code == 200
+    assert client.get("/api/sleep", headers=auth_headers).status_code == 200
+    deleted = client.delete(
+        "/api/sleep/1", params={"date": date.today().isoformat()}, headers=auth_headers
+    )
+    assert deleted.status_code == 200
+    assert client.delete("/api/sleep/1", headers=auth_headers).status_code == 404
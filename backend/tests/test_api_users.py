@@ -0,0 +1,33 @@
+def test_profile_flow_within_query_budgets(client, auth_headers):
+    assert client.get("/api/users/me", headers=auth_headers).json()["name"] == "Test User"
+    updated = client.post("/api/users/me", json={"bio": "Early riser"}, headers=auth_headers)
+    assert updated.status_code == 200
+    assert updated.json()["bio"] == "Early riser"
+    changed = client.post(
+        "/api/users/me/password",
+        json={"currentPassword": "Passw0rd!", "newPassword": "N3wPassw0rd!"},
+        headers=auth_headers
+    )
+    assert changed.status_code == 200
+
+
+def test_user_admin_flow_within_query_budgets(client, admin_headers):
+    created = client.post(
+        "/api/users",
+        json={"name": "New User", "email": "new@example.com", "password": "Passw0rd!"},
+        headers=admin_headers
+    )
+    assert created.status_code == 200
+    user_id = created.json()["user"]["id"]
+
+    assert client.get("/api/users", headers=admin_headers).json()["total"] == 2
+    updated = client.post(
+        f"/api/users/{user_id}", json={"status": "active"}, headers=admin_headers
+    )
+    assert updated.status_code == 200
+    assert client.post(
+        f"/api/users/{user_id}/password", json={"password": "N3wPassw0rd!"}, headers=admin_headers
+    ).status_code == 200
+    deleted = client.delete(f"/api/users/{user_id}", headers=admin_headers)
+    assert deleted.status_code == 200
+    assert deleted.json()["total"] == 1
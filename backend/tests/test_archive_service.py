@@ -0,0 +1,61 @@
+from datetime import date
+
+from app.models import HabitMonthlyBits, HabitYearlyBits
+from app.services import archive_service, habit_service
+
+PAST_MONTHS = {
+    date(2023, 1, 1): "1010101".ljust(31, "0"),
+    date(2023, 2, 1): "0".ljust(31, "1"),
+    date(2024, 12, 1): "1".ljust(31, "0")
+}
+
+
+def _seed_history(db, user_id: int) -> list[int]:
+    habit_service.add_habit(db, user_id, "Read")
+    habit_service.add_habit(db, user_id, "Walk")
+    for habit_id in (1, 2):
+        for month, bits in PAST_MONTHS.items():
+            db.add(HabitMonthlyBits(habit_id=habit_id, month=month, day_bits=bits))
+    db.commit()
+    return [1, 2]
+
+
+def test_pack_and_unpack_year_bits_round_trip():
+    packed = habit_service.pack_year_bits({1: "1".ljust(31, "0"), 12: "1" * 31})
+    assert len(packed) == habit_service.YEAR_BITS_BYTES
+    assert habit_service.unpack_month_bits(packed, 1) == "1".ljust(31, "0")
+    assert habit_service.unpack_month_bits(packed, 6) == "0" * 31
+    assert habit_service.unpack_month_bits(packed, 12) == "1" * 31
+
+
+def test_compaction_keeps_reads_identical(db, user):
+    _seed_history(db, user.id)
+    before = {month: habit_service.list_habits(db, user.id, month) for month in PAST_MONTHS}
+    months_before = habit_service.list_habits(db, user.id)["availableMonths"]
+
+    stats = archive_service.compact_closed_months(db, date.today())
+
+    assert stats["months"] == 6 and stats["years"] == 4
+    current_month = date.today().replace(day=1)
+    assert db.query(HabitMonthlyBits).filter(HabitMonthlyBits.month < current_month).count() == 0
+    assert db.query(HabitYearlyBits).count() == 4
+    db.expire_all()
+    for month, data in before.items():
+        assert habit_service.list_habits(db, user.id, month) == data
+    assert habit_service.list_habits(db, user.id)["availableMonths"] == months_before
+
+
+def test_compaction_merges_into_existing_year(db, user):
+    _seed_history(db, user.id)
+    archive_service.compact_closed_months(db, date.today())
+    db.add(HabitMonthlyBits(habit_id=1, month=date(2023, 3, 1), day_bits="01".ljust(31, "0")))
+    db.commit()
+
+    archive_service.compact_closed_months(db, date.today())
+
+    record = db.query(HabitYearlyBits).filter_by(habit_id=1, year=2023).one()
+    assert record.month_mask == 0b111
+    assert habit_service.unpack_month_bits(record.day_bits, 1) == PAST_MONTHS[date(2023, 1, 1)]
+    march = habit_service.list_habits(db, user.id, date(2023, 3, 1))
+    assert march["habits"] == ["Read"]
+    assert march["habitMatrix"][0]["days"][:2] == [False, True]
@@ -0,0 +1,40 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware import CompressionMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large():
+        return {"rows": [{"id": index, "days": [True] * 31} for index in range(50)]}
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"x" * 1000, b"y" * 1000]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_large_response_is_gzipped():
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers.get("Content-Encoding") == "gzip"
+    assert "Accept-Encoding" in response.headers.get("Vary", "")
+    assert len(response.json()["rows"]) == 50
+
+
+def test_small_and_streaming_responses_are_not_compressed():
+    client = _client()
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+    assert "Content-Encoding" not in stream.headers
+    assert stream.text == "x" * 1000 + "y" * 1000
@@ -0,0 +1,37 @@
+from datetime import date
+
+from sqlalchemy import inspect
+
+from app.core import database
+from app.models.sleep_entry import SleepEntry
+from app.services import sleep_service, user_service
+
+
+def test_pin_to_primary_prunes_expired_pins(monkeypatch):
+    monkeypatch.setattr(database, "ReplicaSessionLocal", object())
+    monkeypatch.setattr(database, "_primary_pins", {})
+
+    database.pin_to_primary(1, seconds=-1)
+    database.pin_to_primary(2, seconds=60)
+
+    assert database._primary_pins.keys() == {2}
+    assert database.is_pinned_to_primary(2)
+
+
+def test_sleep_entry_identity_includes_partition_key(db, user):
+    entry = sleep_service.upsert_sleep(db, user.id, date(2024, 3, 1), 7.0)
+
+    assert [column.name for column in inspect(SleepEntry).primary_key] == ["id", "sleep_date"]
+    assert inspect(entry).identity == (entry.id, date(2024, 3, 1))
+
+
+def test_admin_is_pinned_after_editing_another_user(client, db, user, admin_headers, monkeypatch):
+    monkeypatch.setattr(database, "ReplicaSessionLocal", object())
+    monkeypatch.setattr(database, "_primary_pins", {})
+    admin = user_service.get_user_by_email(db, "admin@example.com")
+
+    response = client.post(f"/api/users/{user.id}", json={"name": "Renamed"}, headers=admin_headers)
+
+    assert response.status_code == 200
+    assert database.is_pinned_to_primary(admin.id)
+    assert not database.is_pinned_to_primary(user.id)
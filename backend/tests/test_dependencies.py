@@ -0,0 +1,28 @@
+from fastapi import Depends
+from sqlalchemy import event
+
+from app.utils.dependencies import get_current_user
+
+
+def test_auth_releases_connection_before_route(client, auth_headers, db_engine):
+    checked_out = [0]
+    held = []
+
+    @event.listens_for(db_engine, "checkout")
+    def on_checkout(*_args):
+        checked_out[0] += 1
+
+    @event.listens_for(db_engine, "checkin")
+    def on_checkin(*_args):
+        checked_out[0] -= 1
+
+    @client.app.get("/api/probe")
+    async def probe(user=Depends(get_current_user)):
+        held.append(checked_out[0])
+        return {"email": user.email}
+
+    response = client.get("/api/probe", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"email": "user@example.com"}
+    assert held == [0]
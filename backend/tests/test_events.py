@@ -0,0 +1,84 @@
+import asyncio
+
+from app.core.events import EventBus, event_bus
+
+
+def test_event_bus_delivers_to_user_subscribers_only():
+    async def scenario():
+        bus = EventBus(queue_size=2)
+        mine = bus.subscribe(1)
+        other = bus.subscribe(2)
+        bus.publish(1, {"type": "habit.toggled", "habitId": 7})
+        event = await asyncio.wait_for(mine.get(), timeout=1)
+        bus.unsubscribe(1, mine)
+        return event, other.empty(), bus.has_subscribers(1)
+
+    event, other_empty, still_subscribed = asyncio.run(scenario())
+    assert event == {"type": "habit.toggled", "habitId": 7}
+    assert other_empty
+    assert not still_subscribed
+
+
+def test_stream_unsubscribes_when_client_disconnects(client, user, auth_headers):
+    async def scenario():
+        disconnected = asyncio.Event()
+        chunks: asyncio.Queue = asyncio.Queue()
+        requested = False
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                await chunks.put(message["body"])
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/events/stream",
+            "raw_path": b"/api/events/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", auth_headers["Authorization"].encode())
+            ],
+            "client": ("127.0.0.1", 1234),
+            "server": ("testserver", 80),
+        }
+        task = asyncio.create_task(client.app(scope, receive, send))
+        assert await asyncio.wait_for(chunks.get(), timeout=5) == b"retry: 5000\n\n"
+        subscribed = event_bus.has_subscribers(user.id)
+        event_bus.publish(user.id, {"type": "habit.toggled", "habitId": 1})
+        event = await asyncio.wait_for(chunks.get(), timeout=5)
+        disconnected.set()
+        await asyncio.wait_for(task, timeout=5)
+        return subscribed, event, event_bus.has_subscribers(user.id)
+
+    subscribed, event, still_subscribed = asyncio.run(scenario())
+    assert subscribed
+    assert event.startswith(b"event: habit.toggled\ndata: ")
+    assert not still_subscribed
+
+
+def test_mutation_events_carry_the_client_id(client, auth_headers, monkeypatch):
+    published = []
+    monkeypatch.setattr(
+        event_bus, "publish", lambda user_id, event, db=None: published.append(event)
+    )
+    headers = {**auth_headers, "X-Client-Id": "tab-1"}
+
+    created = client.post("/api/habits", json={"name": "Read"}, headers=headers)
+    habit_id = created.json()["habit"]["id"]
+    client.post(f"/api/habits/{habit_id}/toggle", json={"dayIndex": 0}, headers=auth_headers)
+
+    assert [event["type"] for event in published] == ["habit.added", "habit.toggled"]
+    assert [event["clientId"] for event in published] == ["tab-1", None]
@@ -0,0 +1,30 @@
+import pytest
+
+from app.core.query_budget import count_queries
+from app.utils.helpers import parse_fields
+
+
+def test_parse_fields():
+    assert parse_fields(None, ("a", "b")) is None
+    assert parse_fields(" a, b ,", ("a", "b")) == {"a", "b"}
+    with pytest.raises(ValueError):
+        parse_fields("a,c", ("a", "b"))
+
+
+@pytest.mark.parametrize("path", ["/api/dashboard", "/api/habits", "/api/sleep"])
+def test_unknown_field_is_rejected(client, auth_headers, path):
+    response = client.get(path, params={"fields": "month,bogus"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", ["/api/dashboard", "/api/habits", "/api/sleep"])
+def test_unrequested_sections_skip_their_queries(client, auth_headers, path):
+    client.post("/api/habits", json={"name": "Read"}, headers=auth_headers)
+    with count_queries() as full:
+        assert client.get(path, headers=auth_headers).status_code == 200
+    with count_queries() as sparse:
+        response = client.get(path, params={"fields": "month"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"month"}
+    assert sparse.count == 1 < full.count
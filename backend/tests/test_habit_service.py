@@ -0,0 +1,76 @@
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models import HabitMonthlyBits
+from app.models.types import day_mask
+from app.schemas.admin import AdminReport
+from app.services import habit_service, sleep_service
+
+
+def test_day_bits_round_trip_on_sqlite(db, user):
+    habit_service.add_habit(db, user.id, "Read")
+    month = habit_service.parse_month(None)
+    result = habit_service.toggle_habit(db, user.id, 1, 2, True, month)
+
+    assert result["habitMatrix"][0]["days"][2] is True
+    record = db.query(HabitMonthlyBits).one()
+    assert record.day_bits == "001".ljust(31, "0")
+
+
+def test_list_habits_bits_encoding_matches_bool_rows(db, user):
+    habit_service.add_habit(db, user.id, "Walk")
+    month = habit_service.parse_month(None)
+    habit_service.toggle_habit(db, user.id, 1, 0, True, month)
+    habit_service.toggle_habit(db, user.id, 1, 4, True, month)
+
+    rows = habit_service.list_habits(db, user.id, month)["habitMatrix"]
+    masks = habit_service.list_habits(
+        db, user.id, month, habit_service.BITS_ENCODING
+    )["habitMatrix"]
+
+    assert masks[0]["days"] == 0b10001
+    assert [index for index, done in enumerate(rows[0]["days"]) if done] == [0, 4]
+
+
+def test_bits_encoding_reads_masks_without_parsing_strings(db, user, monkeypatch):
+    habit_service.add_habit(db, user.id, "Walk")
+    db.add(HabitMonthlyBits(habit_id=1, month=date(2020, 1, 1), day_bits="011".ljust(31, "0")))
+    db.commit()
+    monkeypatch.setattr(
+        habit_service, "_normalize_bits", lambda *args: (_ for _ in ()).throw(AssertionError)
+    )
+
+    rows = habit_service.list_habits(
+        db, user.id, date(2020, 1, 1), habit_service.BITS_ENCODING
+    )["habitMatrix"]
+
+    assert rows[0]["days"] == 0b110
+
+
+def test_day_mask_reverses_bit_strings_on_postgresql():
+    statement = select(day_mask(HabitMonthlyBits.day_bits)).compile(dialect=postgresql.dialect())
+
+    assert "reverse(CAST(habit_monthly_bits.day_bits AS TEXT))::bit(31)::integer" in str(statement)
+
+
+def test_available_months_include_past_rows(db, user):
+    habit_service.add_habit(db, user.id, "Stretch")
+    db.add(HabitMonthlyBits(habit_id=1, month=date(2020, 1, 1), day_bits="1" * 31))
+    db.commit()
+
+    data = habit_service.list_habits(db, user.id, date(2020, 1, 1))
+
+    assert data["habits"] == ["Stretch"]
+    assert "2020-01" in data["availableMonths"]
+    assert all(data["habitMatrix"][0]["days"])
+
+
+def test_admin_report_shape_is_stable_for_empty_user_list(db, user):
+    habit_service.add_habit(db, user.id, "Read")
+    empty = habit_service.get_admin_report(db, [])
+    populated = habit_service.get_admin_report(db, [user.id])
+
+    assert empty.keys() == populated.keys()
+    AdminReport(**empty, sleepReport=sleep_service.get_admin_sleep_report(db, []))
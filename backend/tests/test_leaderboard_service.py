@@ -0,0 +1,101 @@
+import threading
+import time
+from array import array
+from datetime import date
+
+import pytest
+
+from app.core.security import create_access_token
+from app.services import habit_service, leaderboard_service, user_service
+from app.services.leaderboard_service import Leaderboard
+
+
+@pytest.fixture(autouse=True)
+def board(monkeypatch):
+    board = Leaderboard()
+    monkeypatch.setattr(leaderboard_service, "leaderboard", board)
+    return board
+
+
+def _stats(db, user_id: int) -> tuple[int, int]:
+    stats = habit_service.get_dashboard(db, user_id, fields={"stats"})["stats"]
+    return stats["successRate"], stats["streakDays"]
+
+
+def test_toggles_update_scores_incrementally(db, user, board):
+    other = user_service.create_user(db, "Other User", "other@example.com", "Passw0rd!")
+    today_index = date.today().day - 1
+    read = habit_service.add_habit(db, user.id, "Read")["habit"]["id"]
+    habit_service.add_habit(db, user.id, "Walk")
+    walk = habit_service.add_habit(db, other.id, "Walk")["habit"]["id"]
+    board.refresh(db)
+    loaded_at = board.loaded_at
+
+    habit_service.toggle_habit(db, other.id, walk, today_index, True, None)
+    habit_service.toggle_habit(db, user.id, read, today_index, True, None)
+    habit_service.toggle_habit(db, user.id, read, today_index, True, None)
+
+    for owner_id in (other.id, user.id):
+        entry = board.rank(owner_id)
+        assert (entry["successRate"], entry["streakDays"]) == _stats(db, owner_id)
+    assert board.rank(other.id)["rank"] == 1
+    assert [row["userId"] for row in board.top(2)] == [other.id, user.id]
+
+    board.refresh(db)
+    assert board.loaded_at == loaded_at
+
+
+def test_habit_changes_reload_only_that_user(db, user, board):
+    board.refresh(db)
+    assert board.rank(user.id)["successRate"] == 0
+    habit_id = habit_service.add_habit(db, user.id, "Read")["habit"]["id"]
+    habit_service.toggle_habit(db, user.id, habit_id, date.today().day - 1, True, None)
+
+    board.refresh(db)
+
+    assert board.rank(user.id)["successRate"] == _stats(db, user.id)[0] > 0
+    user_service.mark_deleted(db, user.id)
+    board.refresh(db)
+    assert board.rank(user.id) is None and len(board) == 0
+
+
+def test_ties_share_a_rank(db, user, board):
+    user_service.create_user(db, "Other User", "other@example.com", "Passw0rd!")
+    board.refresh(db)
+    assert [row["rank"] for row in board.top(5)] == [1, 1]
+
+
+def test_concurrent_refreshes_rebuild_once(board, monkeypatch):
+    loads = []
+
+    def load_counts(_db, _month, user_ids=None):
+        loads.append(user_ids)
+        time.sleep(0.05)
+        return {1: array("H", bytes(62))}, {1: 0}
+
+    monkeypatch.setattr(leaderboard_service, "_load_counts", load_counts)
+    threads = [threading.Thread(target=board.refresh, args=(None,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [None]
+    assert len(board) == 1
+
+
+def test_leaderboard_endpoint(client, db):
+    admin = user_service.create_user(db, "Admin", "admin@example.com", "Passw0rd!", role="admin")
+    token = create_access_token(subject=str(admin.id), token_version=0)
+
+    response = client.get(
+        "/api/admin/leaderboard",
+        params={"limit": 5, "userId": admin.id},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["totalUsers"] == 1
+    assert data["top"][0]["name"] == "Admin"
+    assert data["user"]["rank"] == 1
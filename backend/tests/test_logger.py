@@ -0,0 +1,62 @@
+import logging
+import queue
+
+from app.core.logger import (
+    BatchRotatingFileHandler,
+    BatchingLogWriter,
+    DroppingQueueHandler,
+    auth_log_dropped,
+)
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("auth", logging.INFO, __file__, 1, message, None, None)
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        self.batches.append([record.getMessage() for record in records])
+
+
+def test_writer_flushes_records_in_batches():
+    log_queue: queue.Queue = queue.Queue()
+    handler = CollectingHandler()
+    writer = BatchingLogWriter(log_queue, handler, batch_size=2)
+    for index in range(5):
+        log_queue.put(_record(f"event-{index}"))
+    writer.start()
+    writer.stop()
+
+    assert [len(batch) for batch in handler.batches] == [2, 2, 1]
+    assert sum(handler.batches, []) == [f"event-{index}" for index in range(5)]
+
+
+def test_full_queue_drops_and_counts(monkeypatch):
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    errors = []
+    monkeypatch.setattr(handler, "handleError", errors.append)
+    before = auth_log_dropped.snapshot().get((), 0.0)
+
+    handler.handle(_record("kept"))
+    handler.handle(_record("dropped"))
+
+    assert handler.queue.qsize() == 1 and not errors
+    assert auth_log_dropped.snapshot()[()] == before + 1
+
+
+def test_rotation_counts_encoded_bytes(tmp_path):
+    path = tmp_path / "auth.log"
+    handler = BatchRotatingFileHandler(
+        path, maxBytes=40, backupCount=2, encoding="utf-8", delay=True
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    handler.emit_batch([_record("é" * 10), _record("é" * 10)])
+    handler.close()
+
+    assert path.read_text(encoding="utf-8") == "é" * 10 + "\n"
+    assert (tmp_path / "auth.log.1").read_text(encoding="utf-8") == "é" * 10 + "\n"
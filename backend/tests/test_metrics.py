@@ -0,0 +1,39 @@
+from app.core.config import settings
+from app.core.middleware import request_duration
+
+
+def test_metrics_endpoint_disabled_by_default(client):
+    assert client.get("/api/metrics").status_code == 404
+
+
+def test_metrics_exposes_request_latency(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENDPOINT_ENABLED", True)
+    client.get("/api/health")
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+    assert "http_requests_in_flight" in response.text
+
+
+def test_metrics_requires_scrape_token_when_configured(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENDPOINT_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_SCRAPE_TOKEN", "scrape-secret")
+
+    assert client.get("/api/metrics").status_code == 401
+    assert client.get(
+        "/api/metrics", headers={"Authorization": "Bearer wrong"}
+    ).status_code == 401
+    response = client.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+
+
+def test_route_label_uses_the_route_template(client, auth_headers):
+    for name in ("Read", "Walk"):
+        created = client.post("/api/habits", json={"name": name}, headers=auth_headers)
+        habit_id = created.json()["habit"]["id"]
+        client.post(f"/api/habits/{habit_id}/toggle", json={"dayIndex": 0}, headers=auth_headers)
+    client.get("/api/missing")
+
+    routes = {key[1] for key in request_duration.snapshot()}
+    assert {route for route in routes if "toggle" in route} == {"/habits/{habit_id}/toggle"}
+    assert "unmatched" in routes
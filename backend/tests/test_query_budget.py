@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import create_engine, text
+
+from app.core.config import Settings
+from app.core.middleware import QueryBudgetMiddleware
+from app.core.query_budget import QueryBudgetExceeded, get_query_budget, query_budget
+
+
+def _budget_app(mode: str) -> FastAPI:
+    engine = create_engine("sqlite://")
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware, mode=mode)
+
+    @app.get("/chatty")
+    @query_budget(1)
+    async def chatty() -> dict:
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {"status": "ok"}
+
+    return app
+
+
+def _api_routes(routes) -> list:
+    collected = []
+    for route in routes:
+        if isinstance(route, APIRoute):
+            collected.append(route)
+        elif hasattr(route, "effective_route_contexts"):
+            collected.extend(route.effective_route_contexts())
+    return collected
+
+
+def test_every_endpoint_declares_a_query_budget(client):
+    routes = _api_routes(client.app.routes)
+    missing = [route.path for route in routes if get_query_budget(route.endpoint) is None]
+    assert routes and missing == []
+
+
+def test_query_counter_counts_engine_statements(query_counter):
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+    assert query_counter.count == 2
+
+
+def test_over_budget_route_fails_in_raise_mode():
+    with pytest.raises(QueryBudgetExceeded):
+        TestClient(_budget_app("raise")).get("/chatty")
+
+
+def test_over_budget_route_warns_in_warn_mode(caplog):
+    response = TestClient(_budget_app("warn")).get("/chatty")
+    assert response.status_code == 200
+    assert "GET /chatty issued 3 queries, budget is 1" in caplog.text
+
+
+def test_unknown_budget_mode_is_rejected():
+    with pytest.raises(ValidationError):
+        Settings(QUERY_BUDGET_MODE="loud")
@@ -0,0 +1,55 @@
+from app.core import security
+from app.core.config import settings
+from app.core.rate_limit import MemoryRateLimitBackend
+
+
+def test_token_bucket_refills_over_time():
+    backend = MemoryRateLimitBackend()
+    assert backend.take("k", 2, 1.0, 0.0) == 0
+    assert backend.take("k", 2, 1.0, 0.0) == 0
+    assert backend.take("k", 2, 1.0, 0.0) == 1.0
+    assert backend.take("k", 2, 1.0, 0.5) == 0.5
+    assert backend.take("k", 2, 1.0, 1.0) == 0
+
+
+def test_memory_backend_is_bounded():
+    backend = MemoryRateLimitBackend(max_keys=2)
+    for key in ("a", "b", "c"):
+        backend.take(key, 1, 1.0, 0.0)
+    assert backend.take("a", 1, 1.0, 0.0) == 0
+
+
+def test_login_is_throttled_per_email_before_hashing(client, user, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_RATE_EMAIL_BURST", 2)
+    credentials = {"email": "user@example.com", "password": "wrong-password"}
+    assert client.post("/api/auth/login", json=credentials).status_code == 401
+    assert client.post("/api/auth/login", json=credentials).status_code == 401
+
+    monkeypatch.setattr(
+        security.pwd_context, "verify", lambda *args: (_ for _ in ()).throw(AssertionError)
+    )
+    throttled = client.post("/api/auth/login", json=credentials)
+    assert throttled.status_code == 429
+    assert int(throttled.headers["Retry-After"]) >= 1
+
+
+def test_successful_logins_do_not_drain_the_email_bucket(client, user, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_RATE_EMAIL_BURST", 2)
+    credentials = {"email": "user@example.com", "password": "Passw0rd!"}
+    for _ in range(3):
+        assert client.post("/api/auth/login", json=credentials).status_code == 200
+
+    wrong = {"email": "user@example.com", "password": "wrong-password"}
+    assert client.post("/api/auth/login", json=wrong).status_code == 401
+    assert client.post("/api/auth/login", json=wrong).status_code == 401
+    assert client.post("/api/auth/login", json=wrong).status_code == 429
+
+
+def test_login_is_throttled_per_ip(client, user, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_RATE_IP_BURST", 1)
+    assert client.post(
+        "/api/auth/login", json={"email": "user@example.com", "password": "Passw0rd!"}
+    ).status_code == 200
+    assert client.post(
+        "/api/auth/login", json={"email": "other@example.com", "password": "Passw0rd!"}
+    ).status_code == 429
@@ -0,0 +1,15 @@
+import pytest
+
+from app.core import responses
+
+PAYLOAD = {"rate": float("nan"), "rows": [1.5, float("inf")], 3: "x"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_maps_non_finite_floats_to_null(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+
+    assert responses.dumps(PAYLOAD) == b'{"rate":null,"rows":[1.5,null],"3":"x"}'
@@ -0,0 +1,64 @@
+from datetime import date, datetime, timedelta, timezone
+
+from app.models import Habit, HabitMonthlyBits, HabitYearlyBits, SleepEntry, User
+from app.services import habit_service, retention_service, sleep_service, user_service
+
+
+def _age(db, model, row_id: int, days: int) -> None:
+    db.get(model, row_id).deleted_at = datetime.now(timezone.utc) - timedelta(days=days)
+    db.commit()
+
+
+def test_purge_removes_expired_habits_and_their_months(db, user):
+    habit_service.add_habit(db, user.id, "Read")
+    habit_service.add_habit(db, user.id, "Walk")
+    habit_service.add_habit(db, user.id, "Swim")
+    for habit_id in (1, 2, 3):
+        db.add(HabitMonthlyBits(habit_id=habit_id, month=date(2023, 1, 1), day_bits="1" * 31))
+    db.add(HabitYearlyBits(habit_id=1, year=2022, month_mask=1, day_bits=b"\x00" * 47))
+    db.commit()
+    habit_service.delete_habit(db, user.id, 1)
+    habit_service.delete_habit(db, user.id, 2)
+    _age(db, Habit, 1, 60)
+
+    assert retention_service.pending_purge(db)["habits"] == 1
+    stats = retention_service.purge_deleted(db, batch_size=1, pause_seconds=0)
+
+    assert stats["habits"] == 1 and stats["habit_years"] == 1
+    assert stats["habit_months"] == 2
+    db.expire_all()
+    assert db.get(Habit, 1) is None
+    assert db.get(Habit, 2) is not None and db.get(Habit, 3) is not None
+    assert db.query(HabitMonthlyBits).filter_by(habit_id=1).count() == 0
+    assert db.query(HabitMonthlyBits).filter_by(habit_id=2).count() > 0
+
+
+def test_purge_removes_expired_users_with_their_data(db, user):
+    user_id = user.id
+    other = user_service.create_user(db, "Other User", "other@example.com", "Passw0rd!")
+    other_id = other.id
+    for owner in (user, other):
+        habit_service.add_habit(db, owner.id, "Read")
+        sleep_service.upsert_sleep(db, owner.id, date.today(), 7.5)
+    assert user_service.mark_deleted(db, user.id)
+    assert user_service.authenticate(db, "user@example.com", "Passw0rd!") is None
+    assert user_service.get_user_by_email(db, "user@example.com") is None
+
+    assert retention_service.purge_deleted(db, pause_seconds=0)["users"] == 0
+    _age(db, User, user.id, 31)
+    stats = retention_service.purge_deleted(db, pause_seconds=0)
+
+    assert stats["users"] == 1 and stats["habits"] == 1 and stats["sleep_entries"] == 1
+    db.expunge_all()
+    assert db.get(User, user_id) is None
+    assert db.query(Habit).filter_by(user_id=other_id).count() == 1
+    assert db.query(SleepEntry).filter_by(user_id=other_id).count() == 1
+
+
+def test_deleted_user_releases_their_email(db, user):
+    assert user_service.mark_deleted(db, user.id)
+
+    replacement = user_service.create_user(db, "New Owner", "user@example.com", "Passw0rd!")
+
+    assert replacement.id != user.id
+    assert user_service.authenticate(db, "user@example.com", "Passw0rd!").id == replacement.id
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+import pytest
+from jose import JWTError
+from passlib.hash import pbkdf2_sha256
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import TokenCache, TokenClaims, create_access_token, decode_access_token
+from app.models import User
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security.token_cache.clear()
+    yield
+    security.token_cache.clear()
+
+
+def test_decode_is_cached_until_expiry(monkeypatch):
+    token = create_access_token(subject="7", token_version=3)
+    calls = []
+    decode = security.jwt.decode
+    monkeypatch.setattr(
+        security.jwt, "decode", lambda *args, **kwargs: calls.append(1) or decode(*args, **kwargs)
+    )
+
+    assert decode_access_token(token)[:2] == (7, 3)
+    assert decode_access_token(token)[:2] == (7, 3)
+    assert len(calls) == 1
+
+    claims = decode_access_token(token)
+    monkeypatch.setattr(security.time, "time", lambda: claims.expires_at + 1)
+    decode_access_token(token)
+    assert len(calls) == 2
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = TokenCache(2)
+    for key in (b"a", b"b"):
+        cache.put(key, TokenClaims(1, 0, 100.0))
+    cache.get(b"a", 0.0)
+    cache.put(b"c", TokenClaims(1, 0, 100.0))
+    assert cache.get(b"b", 0.0) is None
+    assert cache.get(b"a", 0.0) is not None and len(cache) == 2
+
+
+def test_cached_token_is_rejected_after_logout(client, user):
+    token = create_access_token(subject=str(user.id), token_version=0)
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/users/me", headers=headers).status_code == 200
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+    assert client.get("/api/users/me", headers=headers).status_code == 401
+
+
+def test_expired_token_is_not_cached():
+    token = create_access_token(subject="7", expires_delta=timedelta(seconds=-5))
+    with pytest.raises(JWTError):
+        decode_access_token(token)
+    assert len(security.token_cache) == 0
+
+
+@pytest.mark.parametrize("rounds", [1000, settings.PASSWORD_HASH_ROUNDS * 2])
+def test_login_rehashes_outdated_password(client, db, user, rounds):
+    outdated = pbkdf2_sha256.using(rounds=rounds).hash("Passw0rd!")
+    user.password_hash = outdated
+    db.commit()
+    assert security.password_needs_update(outdated)
+
+    response = client.post(
+        "/api/auth/login", json={"email": "user@example.com", "password": "Passw0rd!"}
+    )
+
+    assert response.status_code == 200
+    db.expire_all()
+    upgraded = db.get(User, user.id).password_hash
+    assert upgraded != outdated and not security.password_needs_update(upgraded)
+    assert security.verify_password("Passw0rd!", upgraded)
@@ -3,3 +3,23 @@ def test_security_headers_present(client):
     assert response.headers.get("Content-Security-Policy")
     assert response.headers.get("X-Content-Type-Options") == "nosniff"
     assert response.headers.get("X-Frame-Options") == "DENY"
+
+
+def test_security_headers_on_streaming_response():
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    from app.core.middleware import SecurityHeadersMiddleware
+
+    app = FastAPI()
+    app.add_middleware(SecurityHeadersMiddleware)
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a", b"b"]), headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    response = TestClient(app).get("/stream")
+    assert response.text == "ab"
+    assert response.headers.get("X-Frame-Options") == "SAMEORIGIN"
+    assert response.headers.get("Referrer-Policy") == "no-referrer"
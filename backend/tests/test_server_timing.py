@@ -0,0 +1,43 @@
+import logging
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.middleware import ServerTimingMiddleware
+from app.core.responses import FastJSONResponse
+
+
+def test_server_timing_header_when_enabled():
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get("/timed")
+    async def timed():
+        return FastJSONResponse({"status": "ok"})
+
+    response = TestClient(app).get("/timed")
+    timing = response.headers.get("Server-Timing", "")
+    assert 'db;dur=0.00;desc="0 queries"' in timing
+    assert "serialize;dur=" in timing
+    assert "total;dur=" in timing
+
+
+def test_query_profile_logs_route_template(caplog):
+    engine = create_engine("sqlite://")
+    router = APIRouter(prefix="/items")
+
+    @router.get("/{item_id}")
+    async def item(item_id: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware, capture_statements=True)
+    app.include_router(router, prefix="/api")
+
+    with caplog.at_level(logging.INFO, logger="profiler"):
+        TestClient(app).get("/api/items/7")
+
+    assert "GET /items/{item_id}: 1 queries" in caplog.text
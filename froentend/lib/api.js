@@ -8,6 +8,11 @@ const API_BASE =
 
 const TOKEN_KEY = "habitatAuthToken";
 
+const CLIENT_ID =
+  typeof window !== "undefined" && window.crypto?.randomUUID
+    ? window.crypto.randomUUID()
+    : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
 function getAuthHeaders() {
   if (typeof window === "undefined") {
     return {};
@@ -65,6 +70,7 @@ export async function postJson(endpoint, payload) {
       credentials: "include",
       headers: {
         "Content-Type": "application/json",
+        "X-Client-Id": CLIENT_ID,
         ...getAuthHeaders()
       },
       body: JSON.stringify(payload)
@@ -84,6 +90,7 @@ export async function deleteJson(endpoint) {
       method: "DELETE",
       credentials: "include",
       headers: {
+        "X-Client-Id": CLIENT_ID,
         ...getAuthHeaders()
       }
     });
@@ -96,6 +103,36 @@ export async function deleteJson(endpoint) {
   }
 }
 
+export function subscribeEvents(onEvent) {
+  if (typeof window === "undefined" || typeof window.EventSource === "undefined") {
+    return () => {};
+  }
+  const source = new window.EventSource(`${API_BASE}/events/stream`, {
+    withCredentials: true
+  });
+  const eventTypes = [
+    "habit.added",
+    "habit.toggled",
+    "habit.deleted",
+    "sleep.logged",
+    "sleep.deleted"
+  ];
+  const handler = (message) => {
+    let event;
+    try {
+      event = JSON.parse(message.data);
+    } catch (_error) {
+      return;
+    }
+    if (event.clientId && event.clientId === CLIENT_ID) {
+      return;
+    }
+    onEvent(event);
+  };
+  eventTypes.forEach((type) => source.addEventListener(type, handler));
+  return () => source.close();
+}
+
 export function getApiBase() {
   return API_BASE;
 }
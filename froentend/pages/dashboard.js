@@ -9,7 +9,7 @@ import ChartCard from "../components/ChartCard";
 import HabitTable from "../components/HabitTable";
 import SiteHeader from "../components/SiteHeader";
 import StatCard from "../components/StatCard";
-import { deleteJson, postJson, safeFetchJson } from "../lib/api";
+import { deleteJson, postJson, safeFetchJson, subscribeEvents } from "../lib/api";
 import {
   dashboardStats,
   progressBars as fallbackProgress,
@@ -148,9 +148,10 @@ export default function DashboardPage({ initialDashboard, initialHabits }) {
     const load = async () => {
       setIsLoading(true);
       const monthQuery = selectedMonth ? `?month=${encodeURIComponent(selectedMonth)}` : "";
-      const nextDashboard = await safeFetchJson(`/dashboard${monthQuery}`, initialDashboard);
-      const nextHabits = await safeFetchJson(`/habits${monthQuery}`, initialHabits);
-      const nextProfile = await safeFetchJson("/users/me", null);
+      const bootstrap = await safeFetchJson(`/bootstrap${monthQuery}`, null);
+      const nextDashboard = bootstrap?.dashboard || initialDashboard;
+      const nextHabits = bootstrap?.habits || initialHabits;
+      const nextProfile = bootstrap?.user || null;
 
       if (!isMounted) {
         return;
@@ -186,6 +187,42 @@ export default function DashboardPage({ initialDashboard, initialHabits }) {
     };
   }, [currentMonthKey, initialDashboard, initialHabits, router, selectedMonth]);
 
+  useEffect(() => {
+    if (!userProfile || selectedMonth !== currentMonthKey) {
+      return undefined;
+    }
+    const monthQuery = `?month=${encodeURIComponent(selectedMonth)}`;
+    return subscribeEvents(async (event) => {
+      if (event.type === "habit.toggled" && event.month === selectedMonth) {
+        setHabitsData((previous) => {
+          if (!previous?.habitMatrix) {
+            return previous;
+          }
+          const habitMatrix = previous.habitMatrix.map((habit) => {
+            if (habit.id !== event.habitId) {
+              return habit;
+            }
+            const nextDays = [...habit.days];
+            nextDays[event.dayIndex] = event.done;
+            return { ...habit, days: nextDays };
+          });
+          return { ...previous, habitMatrix };
+        });
+      } else if (event.type === "habit.added" || event.type === "habit.deleted") {
+        const nextHabits = await safeFetchJson(`/habits${monthQuery}`, null);
+        if (nextHabits) {
+          setHabitsData(nextHabits);
+        }
+      } else {
+        return;
+      }
+      const nextDashboard = await safeFetchJson(`/dashboard${monthQuery}`, null);
+      if (nextDashboard) {
+        setDashboard(nextDashboard);
+      }
+    });
+  }, [currentMonthKey, selectedMonth, userProfile]);
+
   useEffect(() => {
     if (!loaderRef.current) {
       return;
@@ -27,7 +27,8 @@ export default function ProfilePage() {
   useEffect(() => {
     let isMounted = true;
     const load = async () => {
-      const data = await safeFetchJson("/users/me", null);
+      const bootstrap = await safeFetchJson("/bootstrap?sections=user", null);
+      const data = bootstrap?.user || null;
       if (!isMounted) {
         return;
       }
@@ -109,9 +109,10 @@ export default function SleepPage({ initialSleep }) {
   useEffect(() => {
     let isMounted = true;
     const load = async () => {
-      const monthQuery = selectedMonth ? `?month=${encodeURIComponent(selectedMonth)}` : "";
-      const nextSleep = await safeFetchJson(`/sleep${monthQuery}`, initialSleep);
-      const nextProfile = await safeFetchJson("/users/me", null);
+      const monthQuery = selectedMonth ? `&month=${encodeURIComponent(selectedMonth)}` : "";
+      const bootstrap = await safeFetchJson(`/bootstrap?sections=user,sleep${monthQuery}`, null);
+      const nextSleep = bootstrap?.sleep || initialSleep;
+      const nextProfile = bootstrap?.user || null;
       if (!isMounted) {
         return;
       }